@@ -46,7 +46,7 @@ def invoke_node_udf(graph, nid, ntype, func, *, ndata=None, orig_nid=None):
     nbatch = NodeBatch(graph, nid if orig_nid is None else orig_nid, ntype, ndata)
     return func(nbatch)
 
-def invoke_edge_udf(graph, eid, etype, func, *, orig_eid=None):
+def invoke_edge_udf(graph, eid, etype, func, *, orig_eid=None, endpoints=None):
     """Invoke user-defined edge function on the given edges.
 
     Parameters
@@ -61,6 +61,9 @@ def invoke_edge_udf(graph, eid, etype, func, *, orig_eid=None):
         The user-defined function.
     orig_eid : Tensor, optional
         Original edge IDs. Useful if the input graph is an extracted subgraph.
+    endpoints : (Tensor, Tensor), optional
+        The source and destination node IDs of the given edges if they are already
+        known by the caller, in which case they are not looked up again.
 
     Returns
     -------
@@ -73,15 +76,18 @@ def invoke_edge_udf(graph, eid, etype, func, *, orig_eid=None):
         u, v, eid = graph.edges(form='all')
         edata = graph._edge_frames[etid]
     else:
-        u, v = graph.find_edges(eid)
+        u, v = graph.find_edges(eid) if endpoints is None else endpoints
         edata = graph._edge_frames[etid].subframe(eid)
     if len(u) == 0:
         dgl_warning('The input graph for the user-defined edge function ' \
                     'does not contain valid edges')
-    srcdata = graph._node_frames[stid].subframe(u)
-    dstdata = graph._node_frames[dtid].subframe(v)
+    # Endpoint features are only sliced if the UDF reads them; feature-only UDFs
+    # on edge data skip building the subframes altogether.
+    srcframe = graph._node_frames[stid]
+    dstframe = graph._node_frames[dtid]
     ebatch = EdgeBatch(graph, eid if orig_eid is None else orig_eid,
-                       etype, srcdata, edata, dstdata)
+                       etype, lambda: srcframe.subframe(u), edata,
+                       lambda: dstframe.subframe(v))
     return func(ebatch)
 
 def invoke_udf_reduce(graph, func, msgdata, *, orig_nid=None):
@@ -277,20 +283,22 @@ def message_passing(g, mfunc, rfunc, afunc):
     dict[str, Tensor]
         Results from the message passing computation.
     """
-    if (is_builtin(mfunc) and is_builtin(rfunc) and
+    mfunc_is_builtin = is_builtin(mfunc)
+    rfunc_is_builtin = is_builtin(rfunc)
+    if (mfunc_is_builtin and rfunc_is_builtin and
             getattr(ops, '{}_{}'.format(mfunc.name, rfunc.name), None) is not None):
         # invoke fused message passing
         ndata = invoke_gspmm(g, mfunc, rfunc)
     else:
         # invoke message passing in two separate steps
         # message phase
-        if is_builtin(mfunc):
+        if mfunc_is_builtin:
             msgdata = invoke_gsddmm(g, mfunc)
         else:
             orig_eid = g.edata.get(EID, None)
             msgdata = invoke_edge_udf(g, ALL, g.canonical_etypes[0], mfunc, orig_eid=orig_eid)
         # reduce phase
-        if is_builtin(rfunc):
+        if rfunc_is_builtin:
             msg = rfunc.msg_field
             ndata = invoke_gspmm(g, fn.copy_e(msg, msg), rfunc, edata=msgdata)
         else:
@@ -99,9 +99,10 @@ def _remove_kwargs_dist(kwargs):
 # we replace it with the storage of the latter column.
 
 def _pop_subframe_storage(subframe, frame):
-    for key, col in subframe._columns.items():
+    for key, col in list(subframe._columns.items()):
         if key in frame._columns and col.storage is frame._columns[key].storage:
-            col.storage = None
+            # the column object itself may be shared with the parent frame
+            subframe._column_for_write(key).storage = None
 
 def _pop_subgraph_storage(subg, g):
     for ntype in subg.ntypes:
@@ -150,6 +150,10 @@ class Column(object):
             A new column
         """
         col = self.clone()
+        if (self.device is None and self.storage is not None and
+                F.context(self.storage) == device):
+            # already on the target device; nothing to copy later
+            return col
         col.device = (device, kwargs)
         return col
 
@@ -201,6 +205,29 @@ class Column(object):
                            % (feat_scheme, self.scheme))
         self.data = F.scatter_row(self.data, rowids, feats)
 
+    def update_(self, rowids, feats):
+        """In-place version of :func:`update`.
+
+        The rows are written into the existing storage if it is materialized;
+        otherwise it falls back to :func:`update`. The inplace write breaks
+        autograd so it must not be used while gradients are being recorded.
+
+        Parameters
+        ----------
+        rowids : Tensor
+            Row IDs.
+        feats : Tensor
+            New features.
+        """
+        if self.index is not None or self.device is not None:
+            self.update(rowids, feats)
+            return
+        feat_scheme = infer_scheme(feats)
+        if feat_scheme != self.scheme:
+            raise DGLError("Cannot update column of scheme %s using feature of scheme %s."
+                           % (feat_scheme, self.scheme))
+        F.scatter_row_inplace(self.storage, rowids, feats)
+
     def extend(self, feats, feat_scheme=None):
         """Extend the feature data.
 
@@ -320,6 +347,34 @@ class Frame(MutableMapping):
         # in the first call and zero initializer will be used later.
         self._initializers = {}  # per-column initializers
         self._default_initializer = None
+        # Names of the columns whose Column objects may be shared with a clone of
+        # this frame. They are copied before being mutated (copy-on-write).
+        self._borrowed = set()
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        # frames pickled by older versions have no copy-on-write bookkeeping
+        self.__dict__.setdefault('_borrowed', set())
+
+    def _column_for_write(self, name):
+        """Return the column of the given name, making sure it is not shared with
+        any clone of this frame so that it can be mutated.
+
+        Parameters
+        ----------
+        name : str
+            The column name.
+
+        Returns
+        -------
+        Column
+            The column owned by this frame.
+        """
+        col = self._columns[name]
+        if name in self._borrowed:
+            col = self._columns[name] = col.clone()
+            self._borrowed.discard(name)
+        return col
 
     def _set_zero_default_initializer(self):
         """Set the default initializer to be zero initializer."""
@@ -413,6 +468,7 @@ class Frame(MutableMapping):
             The column name.
         """
         del self._columns[name]
+        self._borrowed.discard(name)
 
     def add_column(self, name, scheme, ctx):
         """Add a new column to the frame.
@@ -438,6 +494,7 @@ class Frame(MutableMapping):
         init_data = initializer((self.num_rows,) + scheme.shape, scheme.dtype,
                                 ctx, slice(0, self.num_rows))
         self._columns[name] = Column(init_data, scheme)
+        self._borrowed.discard(name)
 
     def add_rows(self, num_rows):
         """Add blank rows to this frame.
@@ -478,6 +535,7 @@ class Frame(MutableMapping):
             raise DGLError('Expected data to have %d rows, got %d.' %
                            (self.num_rows, len(col)))
         self._columns[name] = col
+        self._borrowed.discard(name)
 
     def update_row(self, rowids, data):
         """Update the feature data of the given rows.
@@ -501,7 +559,30 @@ class Frame(MutableMapping):
                 ctx = F.context(val)
                 self.add_column(key, scheme, ctx)
         for key, val in data.items():
-            self._columns[key].update(rowids, val)
+            self._column_for_write(key).update(rowids, val)
+
+    def update_row_(self, rowids, data):
+        """In-place version of :func:`update_row`.
+
+        Rows of existing columns are written into their storage, so the storage
+        must not be shared with tensors that are still in use and gradients must
+        not be recorded. New columns are added as in :func:`update_row`.
+
+        Parameters
+        ----------
+        rowids : Tensor
+            Row Ids.
+        data : dict[str, Tensor]
+            Row data.
+        """
+        for key, val in data.items():
+            if key not in self:
+                scheme = infer_scheme(val)
+                ctx = F.context(val)
+                self.add_column(key, scheme, ctx)
+                self._columns[key].update(rowids, val)
+            else:
+                self._column_for_write(key).update_(rowids, val)
 
     def _append(self, other):
         """Append ``other`` frame to ``self`` frame."""
@@ -523,7 +604,7 @@ class Frame(MutableMapping):
             if key not in self._columns:
                 # the column does not exist; init a new column
                 self.add_column(key, col.scheme, F.context(col.data))
-            self._columns[key].extend(col.data, col.scheme)
+            self._column_for_write(key).extend(col.data, col.scheme)
 
     def append(self, other):
         """Append another frame's data into this frame.
@@ -546,6 +627,7 @@ class Frame(MutableMapping):
         """Clear this frame. Remove all the columns."""
         self._columns = {}
         self._num_rows = 0
+        self._borrowed = set()
 
     def __iter__(self):
         """Return an iterator of columns."""
@@ -578,7 +660,12 @@ class Frame(MutableMapping):
         Frame
             A cloned frame.
         """
-        newframe = Frame(self._columns, self._num_rows)
+        # The Column objects are shared and only copied by whichever frame mutates
+        # one first, so cloning does not touch the individual columns.
+        newframe = Frame(num_rows=self._num_rows)
+        newframe._columns = dict(self._columns)
+        newframe._borrowed = set(self._columns)
+        self._borrowed = set(self._columns)
         newframe._initializers = self._initializers
         newframe._default_initializer = self._default_initializer
         return newframe
@@ -602,6 +689,28 @@ class Frame(MutableMapping):
         newframe._default_initializer = self._default_initializer
         return newframe
 
+    def select(self, keys):
+        """Return a new frame that only contains the given columns.
+
+        The columns are shared with this frame and no index selection is triggered.
+        Keys that do not exist in this frame are ignored.
+
+        Parameters
+        ----------
+        keys : iterable[str]
+            Column names.
+
+        Returns
+        -------
+        Frame
+            A new frame.
+        """
+        subf = Frame({k : self._columns[k] for k in keys if k in self._columns},
+                     self._num_rows)
+        subf._initializers = self._initializers
+        subf._default_initializer = self._default_initializer
+        return subf
+
     def subframe(self, rowids):
         """Return a new frame whose columns are subcolumns of this frame.
 
@@ -642,6 +751,7 @@ class Frame(MutableMapping):
         newframe = self.clone()
         new_columns = {key : col.to(device, **kwargs) for key, col in newframe._columns.items()}
         newframe._columns = new_columns
+        newframe._borrowed = set()
         return newframe
 
     def __repr__(self):
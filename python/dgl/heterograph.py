@@ -3,7 +3,6 @@
 from collections import defaultdict
 from collections.abc import Mapping, Iterable
 from contextlib import contextmanager
-import copy
 import numbers
 import networkx as nx
 import numpy as np
@@ -11,7 +10,7 @@ import numpy as np
 from ._ffi.function import _init_api
 from .base import ALL, SLICE_FULL, NTYPE, NID, ETYPE, EID, is_all, DGLError, dgl_warning
 from . import core
-from . import graph_index
+from . import function as fn
 from . import heterograph_index
 from . import utils
 from . import backend as F
@@ -83,6 +82,11 @@ class DGLHeteroGraph(object):
         self._canonical_etypes = None
         self._batch_num_nodes = None
         self._batch_num_edges = None
+        # Every access of gidx.metagraph returns a new handle with an empty edge cache,
+        # so fetch it once for all the type bookkeeping below. Homogeneous graphs do
+        # not need it.
+        if isinstance(ntypes, tuple) or len(ntypes) != 1 or len(etypes) != 1:
+            metagraph = self._graph.metagraph
 
         # Handle node types
         if isinstance(ntypes, tuple):
@@ -90,7 +94,7 @@ class DGLHeteroGraph(object):
                 errmsg = 'Invalid input. Expect a pair (srctypes, dsttypes) but got {}'.format(
                     ntypes)
                 raise TypeError(errmsg)
-            if not is_unibipartite(self._graph.metagraph):
+            if not is_unibipartite(metagraph):
                 raise ValueError('Invalid input. The metagraph must be a uni-directional'
                                  ' bipartite graph.')
             self._ntypes = ntypes[0] + ntypes[1]
@@ -104,7 +108,7 @@ class DGLHeteroGraph(object):
             if len(ntypes) == 1:
                 src_dst_map = None
             else:
-                src_dst_map = find_src_dst_ntypes(self._ntypes, self._graph.metagraph)
+                src_dst_map = find_src_dst_ntypes(self._ntypes, metagraph)
             self._is_unibipartite = (src_dst_map is not None)
             if self._is_unibipartite:
                 self._srctypes_invmap, self._dsttypes_invmap = src_dst_map
@@ -119,7 +123,7 @@ class DGLHeteroGraph(object):
                 self._canonical_etypes = [(ntypes[0], etypes[0], ntypes[0])]
             else:
                 self._canonical_etypes = make_canonical_etypes(
-                    self._etypes, self._ntypes, self._graph.metagraph)
+                    self._etypes, self._ntypes, metagraph)
 
         # An internal map from etype to canonical etype tuple.
         # If two etypes have the same name, an empty tuple is stored instead to indicate
@@ -132,6 +136,15 @@ class DGLHeteroGraph(object):
                 self._etype2canonical[ety] = self._canonical_etypes[i]
         self._etypes_invmap = {t : i for i, t in enumerate(self._canonical_etypes)}
 
+        # Cached relation slices used by message passing. They only hold graph
+        # structure, never feature frames. See _get_relation_view and
+        # _multi_relation_copy_u_sum.
+        self._relation_view_cache = {}
+        self._multi_relation_cache = {}
+        # The device of the graph structure together with the graph index it was read
+        # from. See the device property.
+        self._device_cache = None
+
         # node and edge frame
         if node_frames is None:
             node_frames = [None] * len(self._ntypes)
@@ -147,12 +160,23 @@ class DGLHeteroGraph(object):
                        for i, frame in enumerate(edge_frames)]
         self._edge_frames = edge_frames
 
+    def __getstate__(self):
+        # The cached relation slices can be rebuilt on demand; do not serialize them.
+        state = self.__dict__.copy()
+        state.pop('_relation_view_cache', None)
+        state.pop('_multi_relation_cache', None)
+        state.pop('_device_cache', None)
+        return state
+
     def __setstate__(self, state):
         # Compatibility check
         # TODO: version the storage
         if isinstance(state, dict):
             # Since 0.5 we use the default __dict__ method
             self.__dict__.update(state)
+            self._relation_view_cache = {}
+            self._multi_relation_cache = {}
+            self._device_cache = None
         elif isinstance(state, tuple) and len(state) == 5:
             # DGL == 0.4.3
             dgl_warning("The object is pickled with DGL == 0.4.3.  "
@@ -188,10 +212,20 @@ class DGLHeteroGraph(object):
 
     def __copy__(self):
         """Shallow copy implementation."""
+        return self._shallow_copy()
+
+    def _shallow_copy(self):
+        """Return a shallow copy of this graph.
+
+        Internal callers use it directly instead of :func:`copy.copy` to skip the
+        generic dispatch of the copy module.
+        """
         #TODO(minjie): too many states in python; should clean up and lower to C
         cls = type(self)
         obj = cls.__new__(cls)
         obj.__dict__.update(self.__dict__)
+        obj._relation_view_cache = {}
+        obj._multi_relation_cache = {}
         return obj
 
     #################################################################
@@ -2048,6 +2082,45 @@ class DGLHeteroGraph(object):
         else:
             return HeteroEdgeDataView(self, self.canonical_etypes, ALL)
 
+    def _get_relation_view(self, etid):
+        """Return the relation slice of the given edge type.
+
+        It is equivalent to ``self[self.canonical_etypes[etid]]``. The structure of
+        the slice is cached as long as the graph index of this graph stays the same,
+        while the feature frames are always taken from this graph at call time, so
+        the cache never keeps the frames of an exited local scope alive.
+
+        Parameters
+        ----------
+        etid : int
+            Edge type ID.
+
+        Returns
+        -------
+        DGLGraph
+            The relation slice.
+        """
+        entry = self._relation_view_cache.get(etid, None)
+        if entry is None or entry[0] is not self._graph:
+            srctype, etype, dsttype = self._canonical_etypes[etid]
+            stid, dtid = self._graph.metagraph.find_edge(etid)
+            if stid == dtid:
+                ntypes = [srctype]
+            else:
+                ntypes = ([srctype], [dsttype])
+            # the template has fresh empty frames that are replaced on every call
+            template = self.__class__(self._graph.get_relation_graph(etid), ntypes, [etype])
+            entry = (self._graph, stid, dtid, template)
+            self._relation_view_cache[etid] = entry
+        _, stid, dtid, template = entry
+        view = template._shallow_copy()
+        if stid == dtid:
+            view._node_frames = [self._node_frames[stid]]
+        else:
+            view._node_frames = [self._node_frames[stid], self._node_frames[dtid]]
+        view._edge_frames = [self._edge_frames[etid]]
+        return view
+
     def _find_etypes(self, key):
         etypes = [
             i for i, (srctype, etype, dsttype) in enumerate(self._canonical_etypes) if
@@ -3986,22 +4059,73 @@ class DGLHeteroGraph(object):
         else:
             u = utils.prepare_tensor(self, u, 'u')
             num_nodes = len(u)
+        # the graph device is looked up once instead of once per feature
+        device = self.device
         for key, val in data.items():
             nfeats = F.shape(val)[0]
             if nfeats != num_nodes:
                 raise DGLError('Expect number of features to match number of nodes (len(u)).'
                                ' Got %d and %d instead.' % (nfeats, num_nodes))
-            if F.context(val) != self.device:
+            val_device = F.context(val)
+            if val_device != device:
                 raise DGLError('Cannot assign node feature "{}" on device {} to a graph on'
                                ' device {}. Call DGLGraph.to() to copy the graph to the'
-                               ' same device.'.format(key, F.context(val), self.device))
+                               ' same device.'.format(key, val_device, device))
 
         if is_all(u):
             self._node_frames[ntid].update(data)
         else:
             self._node_frames[ntid].update_row(u, data)
 
-    def _get_n_repr(self, ntid, u):
+    def _set_n_repr_trusted(self, ntid, u, data):
+        """Internal API to set node features computed by DGL itself.
+
+        Unlike :func:`_set_n_repr`, the function does not check the number of rows
+        and the device of the given features. It is used for writing back the
+        results of built-in reduce functions, whose shapes are guaranteed by
+        construction. Outputs of user-defined functions must go through
+        :func:`_set_n_repr`.
+
+        Parameters
+        ----------
+        ntid : int
+            Node type id.
+        u : ALL or tensor
+            The node(s). Must be ALL or an ID tensor prepared by
+            :func:`utils.prepare_tensor`.
+        data : dict of tensor
+            Node representation.
+        """
+        if is_all(u):
+            self._node_frames[ntid].update(data)
+        else:
+            self._node_frames[ntid].update_row(u, data)
+
+    def _set_n_repr_inplace(self, ntid, u, data):
+        """Internal API to write node features computed by DGL itself into the
+        storage of the existing columns.
+
+        Like :func:`_set_n_repr_trusted`, no check is performed. The caller must
+        make sure that gradients are not being recorded and that the storage of
+        the written columns is not shared with any tensor still in use.
+
+        Parameters
+        ----------
+        ntid : int
+            Node type id.
+        u : ALL or tensor
+            The node(s). Must be ALL or an ID tensor prepared by
+            :func:`utils.prepare_tensor`.
+        data : dict of tensor
+            Node representation.
+        """
+        if is_all(u):
+            # replacing whole columns does not allocate anyway
+            self._node_frames[ntid].update(data)
+        else:
+            self._node_frames[ntid].update_row_(u, data)
+
+    def _get_n_repr(self, ntid, u, keys=None):
         """Get node(s) representation of a single node type.
 
         The returned feature tensor batches multiple node features on the first dimension.
@@ -4012,17 +4136,24 @@ class DGLHeteroGraph(object):
             Node type id.
         u : node, container or tensor
             The node(s).
+        keys : iterable[str], optional
+            If given, only slice the features of these names. Ignored when all the
+            nodes are requested.
 
         Returns
         -------
         dict
             Representation dict from feature name to feature tensor.
         """
+        frame = self._node_frames[ntid]
         if is_all(u):
-            return self._node_frames[ntid]
+            # the graph's own frame, so lazily sliced columns are materialized in place
+            return frame
         else:
+            if keys is not None:
+                frame = frame.select(keys)
             u = utils.prepare_tensor(self, u, 'u')
-            return self._node_frames[ntid].subframe(u)
+            return frame.subframe(u)
 
     def _pop_n_repr(self, ntid, key):
         """Internal API to get and remove the specified node feature.
@@ -4078,15 +4209,18 @@ class DGLHeteroGraph(object):
             num_edges = self._graph.number_of_edges(etid)
         else:
             num_edges = len(eid)
+        # the graph device is looked up once instead of once per feature
+        device = self.device
         for key, val in data.items():
             nfeats = F.shape(val)[0]
             if nfeats != num_edges:
                 raise DGLError('Expect number of features to match number of edges.'
                                ' Got %d and %d instead.' % (nfeats, num_edges))
-            if F.context(val) != self.device:
+            val_device = F.context(val)
+            if val_device != device:
                 raise DGLError('Cannot assign edge feature "{}" on device {} to a graph on'
                                ' device {}. Call DGLGraph.to() to copy the graph to the'
-                               ' same device.'.format(key, F.context(val), self.device))
+                               ' same device.'.format(key, val_device, device))
 
         # set
         if is_all(edges):
@@ -4094,7 +4228,7 @@ class DGLHeteroGraph(object):
         else:
             self._edge_frames[etid].update_row(eid, data)
 
-    def _get_e_repr(self, etid, edges):
+    def _get_e_repr(self, etid, edges, keys=None):
         """Internal API to get edge features.
 
         Parameters
@@ -4104,18 +4238,25 @@ class DGLHeteroGraph(object):
         edges : edges
             Edges can be a pair of endpoint nodes (u, v), or a
             tensor of edge ids. The default value is all the edges.
+        keys : iterable[str], optional
+            If given, only slice the features of these names. Ignored when all the
+            edges are requested.
 
         Returns
         -------
         dict
-            Representation dict
+            Representation dict from feature name to feature tensor.
         """
+        frame = self._edge_frames[etid]
         # parse argument
         if is_all(edges):
-            return dict(self._edge_frames[etid])
+            # the graph's own frame, so lazily sliced columns are materialized in place
+            return frame
         else:
+            if keys is not None:
+                frame = frame.select(keys)
             eid = utils.parse_edges_arg_to_eid(self, edges, etid, 'edges')
-            return self._edge_frames[etid].subframe(eid)
+            return frame.subframe(eid)
 
     def _pop_e_repr(self, etid, key):
         """Get and remove the specified edge repr of a single edge type.
@@ -4202,7 +4343,7 @@ class DGLHeteroGraph(object):
         if is_all(v):
             v_id = self.nodes(ntype)
         else:
-            v_id = utils.prepare_tensor(self, v, 'v')
+            v = v_id = utils.prepare_tensor(self, v, 'v')
         ndata = core.invoke_node_udf(self, v_id, ntype, func, orig_nid=v_id)
         self._set_n_repr(ntid, v, ndata)
 
@@ -4294,7 +4435,7 @@ class DGLHeteroGraph(object):
             raise DGLError('The `inplace` option is removed in v0.5.')
         etid = self.get_etype_id(etype)
         etype = self.canonical_etypes[etid]
-        g = self if etype is None else self[etype]
+        g = self._get_relation_view(etid)
         if is_all(edges):
             eid = ALL
         else:
@@ -4429,19 +4570,94 @@ class DGLHeteroGraph(object):
         # edge type
         etid = self.get_etype_id(etype)
         _, dtid = self._graph.metagraph.find_edge(etid)
-        etype = self.canonical_etypes[etid]
         # edge IDs
         eid = utils.parse_edges_arg_to_eid(self, edges, etid, 'edges')
-        if len(eid) == 0:
-            # no computation
-            return
-        u, v = self.find_edges(eid, etype=etype)
+        g = self._get_relation_view(etid)
+        self._send_and_recv_on_relation(g, dtid, eid, message_func, reduce_func,
+                                        apply_node_func)
+
+    def _send_and_recv_on_relation(self, g, dtid, eid, message_func, reduce_func,
+                                   apply_node_func, inplace=False):
+        """Internal implementation of :func:`send_and_recv` on a relation slice.
+
+        The edge type lookup and the relation slice construction are done by the
+        caller so that they can be reused across multiple invocations
+        (e.g., in :func:`prop_edges`).
+
+        Parameters
+        ----------
+        g : DGLGraph
+            The relation slice of this graph, which has only one edge type.
+        dtid : int
+            The destination node type ID in this graph.
+        eid : Tensor
+            Edge IDs of the relation slice.
+        message_func : callable or dgl.function.BuiltinFunction
+            Message function.
+        reduce_func : callable or dgl.function.BuiltinFunction
+            Reduce function.
+        apply_node_func : callable, optional
+            Apply function.
+        inplace : bool, optional
+            See :func:`_send_and_recv_prepared`.
+
+        Returns
+        -------
+        bool
+            Whether any node feature is written.
+        """
+        u, v = g.find_edges(eid)
+        return self._send_and_recv_prepared(g, dtid, u, v, eid, message_func, reduce_func,
+                                            apply_node_func, inplace)
+
+    def _send_and_recv_prepared(self, g, dtid, u, v, eid, message_func, reduce_func,
+                                apply_node_func, inplace=False):
+        """Internal implementation of :func:`send_and_recv` on a relation slice
+        whose edge endpoints have already been looked up.
+
+        Parameters
+        ----------
+        g : DGLGraph
+            The relation slice of this graph, which has only one edge type.
+        dtid : int
+            The destination node type ID in this graph.
+        u : Tensor
+            Source node IDs of the edges.
+        v : Tensor
+            Destination node IDs of the edges.
+        eid : Tensor
+            Edge IDs of the relation slice.
+        message_func : callable or dgl.function.BuiltinFunction
+            Message function.
+        reduce_func : callable or dgl.function.BuiltinFunction
+            Reduce function.
+        apply_node_func : callable, optional
+            Apply function.
+        inplace : bool, optional
+            If True and there is no apply function, write the results into the
+            storage of the existing node feature columns.
+
+        Returns
+        -------
+        bool
+            Whether any node feature is written.
+        """
+        if F.shape(eid)[0] == 0:
+            # no computation; the shape is host-side metadata so this never
+            # synchronizes with the device
+            return False
         # call message passing onsubgraph
-        g = self if etype is None else self[etype]
         compute_graph, _, dstnodes, _ = _create_compute_graph(g, u, v, eid)
         ndata = core.message_passing(
             compute_graph, message_func, reduce_func, apply_node_func)
-        self._set_n_repr(dtid, dstnodes, ndata)
+        if apply_node_func is not None or not core.is_builtin(reduce_func):
+            # outputs of user-defined functions need to be validated
+            self._set_n_repr(dtid, dstnodes, ndata)
+        elif inplace:
+            self._set_n_repr_inplace(dtid, dstnodes, ndata)
+        else:
+            self._set_n_repr_trusted(dtid, dstnodes, ndata)
+        return True
 
     def pull(self,
              v,
@@ -4538,14 +4754,47 @@ class DGLHeteroGraph(object):
             return
         etid = self.get_etype_id(etype)
         _, dtid = self._graph.metagraph.find_edge(etid)
-        etype = self.canonical_etypes[etid]
-        g = self if etype is None else self[etype]
+        g = self._get_relation_view(etid)
+        self._pull_on_relation(g, dtid, v, message_func, reduce_func, apply_node_func)
+
+    def _pull_on_relation(self, g, dtid, v, message_func, reduce_func, apply_node_func,
+                          inplace=False):
+        """Internal implementation of :func:`pull` on a relation slice.
+
+        The edge type lookup and the relation slice construction are done by the
+        caller so that they can be reused across multiple invocations
+        (e.g., in :func:`prop_nodes`).
+
+        Parameters
+        ----------
+        g : DGLGraph
+            The relation slice of this graph, which has only one edge type.
+        dtid : int
+            The destination node type ID in this graph.
+        v : Tensor
+            The non-empty node ID tensor of the destination nodes.
+        message_func : callable or dgl.function.BuiltinFunction
+            Message function.
+        reduce_func : callable or dgl.function.BuiltinFunction
+            Reduce function.
+        apply_node_func : callable, optional
+            Apply function.
+        inplace : bool, optional
+            If True and there is no apply function, write the results into the
+            storage of the existing node feature columns.
+        """
         # call message passing on subgraph
         src, dst, eid = g.in_edges(v, form='all')
         compute_graph, _, dstnodes, _ = _create_compute_graph(g, src, dst, eid, v)
         ndata = core.message_passing(
             compute_graph, message_func, reduce_func, apply_node_func)
-        self._set_n_repr(dtid, dstnodes, ndata)
+        if apply_node_func is not None or not core.is_builtin(reduce_func):
+            # outputs of user-defined functions need to be validated
+            self._set_n_repr(dtid, dstnodes, ndata)
+        elif inplace:
+            self._set_n_repr_inplace(dtid, dstnodes, ndata)
+        else:
+            self._set_n_repr_trusted(dtid, dstnodes, ndata)
 
     def push(self,
              u,
@@ -4629,8 +4878,13 @@ class DGLHeteroGraph(object):
         """
         if inplace:
             raise DGLError('The `inplace` option is removed in v0.5.')
-        edges = self.out_edges(u, form='eid', etype=etype)
-        self.send_and_recv(edges, message_func, reduce_func, apply_node_func, etype=etype)
+        etid = self.get_etype_id(etype)
+        _, dtid = self._graph.metagraph.find_edge(etid)
+        g = self._get_relation_view(etid)
+        # the out-edge lookup already gives the endpoints, so skip find_edges
+        src, dst, eid = g.out_edges(u, form='all')
+        self._send_and_recv_prepared(g, dtid, src, dst, eid, message_func, reduce_func,
+                                     apply_node_func)
 
     def update_all(self,
                    message_func,
@@ -4703,11 +4957,14 @@ class DGLHeteroGraph(object):
                 [3.]])
         """
         etid = self.get_etype_id(etype)
-        etype = self.canonical_etypes[etid]
         _, dtid = self._graph.metagraph.find_edge(etid)
-        g = self if etype is None else self[etype]
+        g = self._get_relation_view(etid)
         ndata = core.message_passing(g, message_func, reduce_func, apply_node_func)
-        self._set_n_repr(dtid, ALL, ndata)
+        if apply_node_func is None and core.is_builtin(reduce_func):
+            self._set_n_repr_trusted(dtid, ALL, ndata)
+        else:
+            # outputs of user-defined functions need to be validated
+            self._set_n_repr(dtid, ALL, ndata)
 
     #################################################################
     # Message passing on heterograph
@@ -4782,27 +5039,117 @@ class DGLHeteroGraph(object):
         tensor([[0.],
                 [4.]])
         """
-        all_out = defaultdict(list)
-        merge_order = defaultdict(list)
+        # parse the arguments first so that the edge types can be visited in ID order
+        etype_args = []
         for etype, args in etype_dict.items():
             etid = self.get_etype_id(etype)
-            _, dtid = self._graph.metagraph.find_edge(etid)
             args = pad_tuple(args, 3)
             if args is None:
                 raise DGLError('Invalid arguments for edge type "{}". Should be '
                                '(msg_func, reduce_func, [apply_node_func])'.format(etype))
-            mfunc, rfunc, afunc = args
-            g = self if etype is None else self[etype]
-            all_out[dtid].append(core.message_passing(g, mfunc, rfunc, afunc))
-            merge_order[dtid].append(etid)  # use edge type id as merge order hint
-        for dtid, frames in all_out.items():
+            etype_args.append((etid,) + args)
+        etype_args.sort(key=lambda x: x[0])
+        # group the edge types by their destination node types; each group is in
+        # edge type ID order, which is also the merge order of the outputs
+        etype_groups = defaultdict(list)
+        for item in etype_args:
+            _, dtid = self._graph.metagraph.find_edge(item[0])
+            etype_groups[dtid].append(item)
+        # all the messages are computed before any node feature is updated
+        all_out = {}
+        for dtid, group in etype_groups.items():
+            if cross_reducer == 'sum' and self._can_fuse_copy_u_sum(group):
+                # one g-SpMM on the flattened relations instead of one per edge type
+                etids = [etid for etid, _, _, _ in group]
+                _, mfunc, rfunc, _ = group[0]
+                all_out[dtid] = [self._multi_relation_copy_u_sum(etids, mfunc, rfunc)]
+                continue
+            outs = all_out[dtid] = [None] * len(group)
+            for i, (etid, mfunc, rfunc, afunc) in enumerate(group):
+                g = self._get_relation_view(etid)
+                outs[i] = core.message_passing(g, mfunc, rfunc, afunc)
+        for dtid, outs in all_out.items():
             # merge by cross_reducer
-            self._node_frames[dtid].update(
-                reduce_dict_data(frames, cross_reducer, merge_order[dtid]))
+            self._node_frames[dtid].update(reduce_dict_data(outs, cross_reducer))
             # apply
             if apply_node_func is not None:
                 self.apply_nodes(apply_node_func, ALL, self.ntypes[dtid])
 
+    def _can_fuse_copy_u_sum(self, group):
+        """Return whether the message passing on a group of edge types sharing the
+        same destination node type can be fused into one copy_u-sum g-SpMM.
+
+        The fusion is exact only if every edge type copies the same source feature
+        and sums the messages, without any type-wise apply function, since the sum
+        over all the in-edges equals the sum of the type-wise sums.
+
+        Parameters
+        ----------
+        group : list[(int, callable, callable, callable)]
+            The (etid, message_func, reduce_func, apply_node_func) tuples.
+
+        Returns
+        -------
+        bool
+        """
+        if len(group) < 2 or len(set(etid for etid, _, _, _ in group)) != len(group):
+            return False
+        _, mfunc0, rfunc0, _ = group[0]
+        for etid, mfunc, rfunc, afunc in group:
+            if afunc is not None:
+                return False
+            if not (isinstance(mfunc, fn.CopyMessageFunction) and
+                    mfunc.target == fn.TargetCode.SRC and
+                    core.is_builtin(rfunc) and rfunc.name == 'sum'):
+                return False
+            if (mfunc.in_field != mfunc0.in_field or mfunc.out_field != mfunc0.out_field or
+                    rfunc.msg_field != rfunc0.msg_field or
+                    rfunc.out_field != rfunc0.out_field):
+                return False
+            stid, _ = self._graph.metagraph.find_edge(etid)
+            if mfunc.in_field not in self._node_frames[stid]:
+                # let the type-wise message passing raise the error
+                return False
+        return True
+
+    def _multi_relation_copy_u_sum(self, etids, mfunc, rfunc):
+        """Invoke a copy_u-sum g-SpMM on the union of the given edge types.
+
+        All the edge types must share the same destination node type. The source
+        node features are concatenated according to the flattened relation graph.
+
+        Parameters
+        ----------
+        etids : list[int]
+            Edge type IDs.
+        mfunc : dgl.function.CopyMessageFunction
+            The copy_u message function.
+        rfunc : dgl.function.SimpleReduceFunction
+            The sum reduce function.
+
+        Returns
+        -------
+        dict[str, Tensor]
+            The reduced features of all the destination nodes.
+        """
+        key = tuple(etids)
+        entry = self._multi_relation_cache.get(key, None)
+        if entry is None or entry[0] is not self._graph:
+            flat = self._graph.flatten_relations(etids)
+            stids = flat.induced_srctype_set.asnumpy()
+            if flat.graph.number_of_ntypes() == 1:
+                g = DGLHeteroGraph(flat.graph, ['_N'], ['_E'])
+            else:
+                g = DGLHeteroGraph(flat.graph, (['_U'], ['_V']), ['_E'])
+            entry = (self._graph, stids, g)
+            self._multi_relation_cache[key] = entry
+        _, stids, g = entry
+        if len(stids) == 1:
+            srcframe = self._node_frames[stids[0]]
+        else:
+            srcframe = combine_frames(self._node_frames, stids, [mfunc.in_field])
+        return core.invoke_gspmm(g, mfunc, rfunc, srcdata=srcframe)
+
     #################################################################
     # Message propagation
     #################################################################
@@ -4812,7 +5159,8 @@ class DGLHeteroGraph(object):
                    message_func,
                    reduce_func,
                    apply_node_func=None,
-                   etype=None):
+                   etype=None,
+                   write_inplace=False):
         """Propagate messages using graph traversal by sequentially triggering
         :func:`pull()` on nodes.
 
@@ -4844,6 +5192,13 @@ class DGLHeteroGraph(object):
               triplet format in the graph.
 
             Can be omitted if the graph has only one type of edges.
+        write_inplace : bool, optional
+            If True, frontiers after the first one write the output feature into
+            the storage created by the first one instead of allocating a new
+            tensor. It only takes effect with a built-in reduce function, no apply
+            function and gradients not being recorded. A tensor of the output
+            feature read in between frontiers (e.g., inside the generator) may
+            then be modified. Default: ``False``.
 
         Examples
         --------
@@ -4867,15 +5222,31 @@ class DGLHeteroGraph(object):
         --------
         prop_edges
         """
+        # The edge type and the relation slice are invariant across frontiers.
+        etid = self.get_etype_id(etype)
+        _, dtid = self._graph.metagraph.find_edge(etid)
+        g = self._get_relation_view(etid)
+        # After the first step the reduced features live in a column storage created
+        # by this propagation, so if requested later steps overwrite its rows in place
+        # as long as the column still holds that storage.
+        produced = None
         for node_frontier in nodes_generator:
-            self.pull(node_frontier, message_func, reduce_func, apply_node_func, etype=etype)
+            v = utils.prepare_tensor(self, node_frontier, 'nodes_generator')
+            if len(v) == 0:
+                continue
+            inplace = write_inplace and _can_write_inplace(
+                self._node_frames[dtid], produced, reduce_func, apply_node_func)
+            self._pull_on_relation(g, dtid, v, message_func, reduce_func, apply_node_func,
+                                   inplace)
+            produced = _reduced_storage(self._node_frames[dtid], reduce_func)
 
     def prop_edges(self,
                    edges_generator,
                    message_func,
                    reduce_func,
                    apply_node_func=None,
-                   etype=None):
+                   etype=None,
+                   write_inplace=False):
         """Propagate messages using graph traversal by sequentially triggering
         :func:`send_and_recv()` on edges.
 
@@ -4907,6 +5278,13 @@ class DGLHeteroGraph(object):
               triplet format in the graph.
 
             Can be omitted if the graph has only one type of edges.
+        write_inplace : bool, optional
+            If True, frontiers after the first one write the output feature into
+            the storage created by the first one instead of allocating a new
+            tensor. It only takes effect with a built-in reduce function, no apply
+            function and gradients not being recorded. A tensor of the output
+            feature read in between frontiers (e.g., inside the generator) may
+            then be modified. Default: ``False``.
 
         Examples
         --------
@@ -4931,9 +5309,21 @@ class DGLHeteroGraph(object):
         --------
         prop_nodes
         """
+        # The edge type and the relation slice are invariant across frontiers.
+        etid = self.get_etype_id(etype)
+        _, dtid = self._graph.metagraph.find_edge(etid)
+        g = self._get_relation_view(etid)
+        # After the first non-empty step the reduced features live in a column
+        # storage created by this propagation, so if requested later steps overwrite
+        # its rows in place as long as the column still holds that storage.
+        produced = None
         for edge_frontier in edges_generator:
-            self.send_and_recv(edge_frontier, message_func, reduce_func,
-                               apply_node_func, etype=etype)
+            eid = utils.parse_edges_arg_to_eid(self, edge_frontier, etid, 'edges_generator')
+            inplace = write_inplace and _can_write_inplace(
+                self._node_frames[dtid], produced, reduce_func, apply_node_func)
+            if self._send_and_recv_on_relation(
+                    g, dtid, eid, message_func, reduce_func, apply_node_func, inplace):
+                produced = _reduced_storage(self._node_frames[dtid], reduce_func)
 
     #################################################################
     # Misc
@@ -5006,20 +5396,23 @@ class DGLHeteroGraph(object):
         >>> print(g.filter_nodes(nodes_with_feature_one, ntype='user'))
         tensor([1, 2])
         """
+        ntid = self.get_ntype_id(ntype)
+        ntype = self.ntypes[ntid]
         if is_all(nodes):
-            nodes = self.nodes(ntype)
-        v = utils.prepare_tensor(self, nodes, 'nodes')
-        if F.as_scalar(F.sum(self.has_nodes(v, ntype=ntype), dim=0)) != len(v):
-            raise DGLError('v contains invalid node IDs')
-
-        with self.local_scope():
-            self.apply_nodes(lambda nbatch: {'_mask' : predicate(nbatch)}, nodes, ntype)
-            ntype = self.ntypes[0] if ntype is None else ntype
-            mask = self.nodes[ntype].data['_mask']
-            if is_all(nodes):
-                return F.nonzero_1d(mask)
-            else:
-                return F.boolean_mask(v, F.gather_row(mask, v))
+            # the IDs of the whole graph are returned as int64 regardless of idtype
+            v = F.arange(0, self._graph.number_of_nodes(ntid), F.int64, self.device)
+        else:
+            v = utils.prepare_tensor(self, nodes, 'nodes')
+            utils.validate_id_tensor(v, self._graph.number_of_nodes(ntid), 'v')
+            nodes = v
+        # The predicate output is used as a mask directly without being written to
+        # the graph.
+        mask = core.invoke_node_udf(self, nodes, ntype, predicate)
+        if F.shape(mask)[0] != F.shape(v)[0]:
+            raise DGLError('Expect the predicate to return one value per node.'
+                           ' Got {} values for {} nodes.'.format(F.shape(mask)[0],
+                                                                 F.shape(v)[0]))
+        return _mask_ids(v, mask, is_all(nodes))
 
     def filter_edges(self, predicate, edges=ALL, etype=None):
         """Return the IDs of the edges with the given edge type that satisfy
@@ -5097,40 +5490,39 @@ class DGLHeteroGraph(object):
         >>> print(g.filter_edges(edges_with_feature_one, etype='plays'))
         tensor([1, 2])
         """
+        etid = self.get_etype_id(etype)
+        endpoints = None
         if is_all(edges):
-            pass
+            # the IDs of the whole graph are returned as int64 regardless of idtype
+            eid = F.arange(0, self._graph.number_of_edges(etid), F.int64, self.device)
         elif isinstance(edges, tuple):
             u, v = edges
-            srctype, _, dsttype = self.to_canonical_etype(etype)
+            stid, dtid = self._graph.metagraph.find_edge(etid)
             u = utils.prepare_tensor(self, u, 'u')
-            if F.as_scalar(F.sum(self.has_nodes(u, ntype=srctype), dim=0)) != len(u):
-                raise DGLError('edges[0] contains invalid node IDs')
+            utils.validate_id_tensor(u, self._graph.number_of_nodes(stid), 'edges[0]')
             v = utils.prepare_tensor(self, v, 'v')
-            if F.as_scalar(F.sum(self.has_nodes(v, ntype=dsttype), dim=0)) != len(v):
-                raise DGLError('edges[1] contains invalid node IDs')
+            utils.validate_id_tensor(v, self._graph.number_of_nodes(dtid), 'edges[1]')
+            # look up the edge IDs once; they are used both for the predicate and the
+            # result, while the given endpoints spare the reverse lookup
+            edges = eid = self.edge_ids(u, v, etype=etype)
+            endpoints = (u, v)
         elif isinstance(edges, Iterable) or F.is_tensor(edges):
-            edges = utils.prepare_tensor(self, edges, 'edges')
-            min_eid = F.as_scalar(F.min(edges, 0))
-            if len(edges) > 0 > min_eid:
-                raise DGLError('Invalid edge ID {:d}'.format(min_eid))
-            max_eid = F.as_scalar(F.max(edges, 0))
-            if len(edges) > 0 and max_eid >= self.num_edges(etype):
-                raise DGLError('Invalid edge ID {:d}'.format(max_eid))
+            # the range of the IDs is validated by find_edges when the predicate
+            # batch is built, so it is not checked twice here
+            edges = eid = utils.prepare_tensor(self, edges, 'edges')
         else:
             raise ValueError('Unsupported type of edges:', type(edges))
 
-        with self.local_scope():
-            self.apply_edges(lambda ebatch: {'_mask' : predicate(ebatch)}, edges, etype)
-            etype = self.canonical_etypes[0] if etype is None else etype
-            mask = self.edges[etype].data['_mask']
-            if is_all(edges):
-                return F.nonzero_1d(mask)
-            else:
-                if isinstance(edges, tuple):
-                    e = self.edge_ids(edges[0], edges[1], etype=etype)
-                else:
-                    e = utils.prepare_tensor(self, edges, 'edges')
-                return F.boolean_mask(e, F.gather_row(mask, e))
+        # The predicate output is used as a mask directly without being written to
+        # the graph.
+        mask = core.invoke_edge_udf(self._get_relation_view(etid), edges,
+                                    self.canonical_etypes[etid], predicate,
+                                    endpoints=endpoints)
+        if F.shape(mask)[0] != F.shape(eid)[0]:
+            raise DGLError('Expect the predicate to return one value per edge.'
+                           ' Got {} values for {} edges.'.format(F.shape(mask)[0],
+                                                                 F.shape(eid)[0]))
+        return _mask_ids(eid, mask, is_all(edges))
 
     @property
     def device(self):
@@ -5157,7 +5549,12 @@ class DGLHeteroGraph(object):
 
         The case of heterogeneous graphs is the same.
         """
-        return F.to_backend_ctx(self._graph.ctx)
+        # The cached device is only valid for the graph index it was read from, so
+        # replacing self._graph (e.g. in to() or the mutation methods) invalidates it.
+        cache = self._device_cache
+        if cache is None or cache[0] is not self._graph:
+            cache = self._device_cache = (self._graph, F.to_backend_ctx(self._graph.ctx))
+        return cache[1]
 
     def to(self, device, **kwargs):  # pylint: disable=invalid-name
         """Move ndata, edata and graph structure to the targeted device (cpu/gpu).
@@ -5209,7 +5606,7 @@ class DGLHeteroGraph(object):
         if device is None or self.device == device:
             return self
 
-        ret = copy.copy(self)
+        ret = self._shallow_copy()
 
         # 1. Copy graph structure
         ret._graph = self._graph.copy_to(utils.to_dgl_context(device))
@@ -5228,13 +5625,9 @@ class DGLHeteroGraph(object):
 
         # 2. Copy misc info
         if self._batch_num_nodes is not None:
-            new_bnn = {k : F.copy_to(num, device, **kwargs)
-                       for k, num in self._batch_num_nodes.items()}
-            ret._batch_num_nodes = new_bnn
+            ret._batch_num_nodes = _copy_tensor_dict_to(self._batch_num_nodes, device, **kwargs)
         if self._batch_num_edges is not None:
-            new_bne = {k : F.copy_to(num, device, **kwargs)
-                       for k, num in self._batch_num_edges.items()}
-            ret._batch_num_edges = new_bne
+            ret._batch_num_edges = _copy_tensor_dict_to(self._batch_num_edges, device, **kwargs)
 
         return ret
 
@@ -5262,18 +5655,16 @@ class DGLHeteroGraph(object):
         """
         # XXX(minjie): Do a shallow copy first to clone some internal metagraph information.
         #   Not a beautiful solution though.
-        ret = copy.copy(self)
+        ret = self._shallow_copy()
 
-        # Clone the graph structure
-        meta_edges = []
-        for s_ntype, _, d_ntype in self.canonical_etypes:
-            meta_edges.append((self.get_ntype_id(s_ntype), self.get_ntype_id(d_ntype)))
-
-        metagraph = graph_index.from_edge_list(meta_edges, True)
+        # Clone the graph structure. Types are visited by ID so that no type name
+        # needs to be resolved. The metagraph is immutable so it is reused as is.
+        metagraph = self._graph.metagraph
         # rebuild graph idx
-        num_nodes_per_type = [self.number_of_nodes(c_ntype) for c_ntype in self.ntypes]
-        relation_graphs = [self._graph.get_relation_graph(self.get_etype_id(c_etype))
-                           for c_etype in self.canonical_etypes]
+        num_nodes_per_type = [self._graph.number_of_nodes(ntid)
+                              for ntid in range(len(self.ntypes))]
+        relation_graphs = [self._graph.get_relation_graph(etid)
+                           for etid in range(len(self.canonical_etypes))]
         ret._graph = heterograph_index.create_heterograph_from_relations(
             metagraph, relation_graphs, utils.toindex(num_nodes_per_type, "int64"))
 
@@ -5351,7 +5742,7 @@ class DGLHeteroGraph(object):
         --------
         local_scope
         """
-        ret = copy.copy(self)
+        ret = self._shallow_copy()
         ret._node_frames = [fr.clone() for fr in self._node_frames]
         ret._edge_frames = [fr.clone() for fr in self._edge_frames]
         return ret
@@ -5502,7 +5893,7 @@ class DGLHeteroGraph(object):
             return self._graph.formats()
         else:
             # Convert the graph to use another format
-            ret = copy.copy(self)
+            ret = self._shallow_copy()
             ret._graph = self._graph.formats(formats)
             return ret
 
@@ -5567,11 +5958,10 @@ class DGLHeteroGraph(object):
         if self.idtype == idtype:
             return self
         bits = 32 if idtype == F.int32 else 64
-        ret = copy.copy(self)
+        ret = self._shallow_copy()
         ret._graph = self._graph.asbits(bits)
         return ret
 
-    # TODO: Formats should not be specified, just saving all the materialized formats
     def shared_memory(self, name, formats=('coo', 'csr', 'csc')):
         """Return a copy of this graph in shared memory, without node data or edge data.
 
@@ -5583,8 +5973,10 @@ class DGLHeteroGraph(object):
         ----------
         name : str
             The name of the shared memory.
-        formats : str or a list of str (optional)
-            Desired formats to be materialized.
+        formats : str or a list of str or None (optional)
+            Desired formats to be materialized. If None, only the formats that
+            have already been created for this graph are copied, so no new sparse
+            format is built just for the shared memory copy.
 
         Returns
         -------
@@ -5592,6 +5984,8 @@ class DGLHeteroGraph(object):
             The graph in shared memory
         """
         assert len(name) > 0, "The name of shared memory cannot be empty"
+        if formats is None:
+            formats = self.formats()['created']
         assert len(formats) > 0
         if isinstance(formats, str):
             formats = [formats]
@@ -5858,7 +6252,7 @@ def is_unibipartite(graph):
         True if the graph is a uni-bipartite.
     """
     src, dst, _ = graph.edges()
-    return set(src.tonumpy()).isdisjoint(set(dst.tonumpy()))
+    return np.intersect1d(src.tonumpy(), dst.tonumpy()).size == 0
 
 def find_src_dst_ntypes(ntypes, metagraph):
     """Internal function to split ntypes into SRC and DST categories.
@@ -5900,12 +6294,13 @@ def pad_tuple(tup, length, pad_val=None):
     """
     if not isinstance(tup, tuple):
         tup = (tup, )
-    if len(tup) > length:
-        return None
-    elif len(tup) == length:
+    num = len(tup)
+    if num == length:
         return tup
+    elif num > length:
+        return None
     else:
-        return tup + (pad_val,) * (length - len(tup))
+        return tup + (pad_val,) * (length - num)
 
 def reduce_dict_data(frames, reducer, order=None):
     """Merge tensor dictionaries into one. Resolve conflict fields using reducer.
@@ -5939,6 +6334,8 @@ def reduce_dict_data(frames, reducer, order=None):
             sorted_with_key = sorted(zip(frames, order), key=lambda x: x[1])
             frames = list(zip(*sorted_with_key))[0]
         def merger(flist):
+            if len(flist) == 1:
+                return F.unsqueeze(flist[0], 1)
             return F.stack(flist, 1)
     else:
         redfn = getattr(F, reducer, None)
@@ -5946,18 +6343,19 @@ def reduce_dict_data(frames, reducer, order=None):
             raise DGLError('Invalid cross type reducer. Must be one of '
                            '"sum", "max", "min", "mean" or "stack".')
         def merger(flist):
-            return redfn(F.stack(flist, 0), 0) if len(flist) > 1 else flist[0]
-    keys = set()
+            if len(flist) == 1:
+                return flist[0]
+            if reducer == 'sum' and len(flist) == 2:
+                # A single elementwise kernel that avoids materializing the stacked buffer.
+                return flist[0] + flist[1]
+            # Reduce all the inputs with one stack and one reduction kernel.
+            return redfn(F.stack(flist, 0), 0)
+    # group the tensors by key in one pass; keys keep their first-seen order
+    buckets = {}
     for frm in frames:
-        keys.update(frm.keys())
-    ret = {}
-    for k in keys:
-        flist = []
-        for frm in frames:
-            if k in frm:
-                flist.append(frm[k])
-        ret[k] = merger(flist)
-    return ret
+        for k, v in frm.items():
+            buckets.setdefault(k, []).append(v)
+    return {k : merger(flist) for k, flist in buckets.items()}
 
 def combine_frames(frames, ids, col_names=None):
     """Merge the frames into one frame, taking the common columns.
@@ -5978,27 +6376,31 @@ def combine_frames(frames, ids, col_names=None):
     Frame
         The resulting frame
     """
-    # find common columns and check if their schemes match
+    # find common columns and check if their schemes match; Frame.schemes builds a
+    # new dictionary on every access, so take it once per frame
+    frame_schemes = [frames[i].schemes for i in ids]
     if col_names is None:
-        schemes = {key: scheme for key, scheme in frames[ids[0]].schemes.items()}
+        schemes = frame_schemes[0]
     else:
-        schemes = {key: frames[ids[0]].schemes[key] for key in col_names}
-    for frame_id in ids:
-        frame = frames[frame_id]
+        schemes = {key: frame_schemes[0][key] for key in col_names}
+    for frame_scheme in frame_schemes[1:]:
         for key, scheme in list(schemes.items()):
-            if key in frame.schemes:
-                if frame.schemes[key] != scheme:
-                    raise DGLError('Cannot concatenate column %s with shape %s and shape %s' %
-                                   (key, frame.schemes[key], scheme))
-            else:
+            other = frame_scheme.get(key, None)
+            if other is None:
                 del schemes[key]
+            elif other != scheme:
+                raise DGLError('Cannot concatenate column %s with shape %s and shape %s' %
+                               (key, other, scheme))
 
     if len(schemes) == 0:
         return None
 
-    # concatenate the columns
-    to_cat = lambda key: [frames[i][key] for i in ids if frames[i].num_rows > 0]
-    cols = {key: F.cat(to_cat(key), dim=0) for key in schemes}
+    # concatenate the columns; with a single non-empty frame its columns are used as is
+    nonempty_ids = [i for i in ids if frames[i].num_rows > 0]
+    if len(nonempty_ids) == 1:
+        frame = frames[nonempty_ids[0]]
+        return Frame({key: frame[key] for key in schemes})
+    cols = {key: F.cat([frames[i][key] for i in nonempty_ids], dim=0) for key in schemes}
     return Frame(cols)
 
 def combine_names(names, ids=None):
@@ -6052,6 +6454,96 @@ class DGLBlock(DGLHeteroGraph):
                 srcnode=nsrcnode_dict, dstnode=ndstnode_dict, edge=nedge_dict, meta=meta)
 
 
+def _copy_tensor_dict_to(tensors, device, **kwargs):
+    """Copy a dictionary of small 1D tensors to the given device.
+
+    Tensors already on the device are kept. The others are concatenated and moved
+    with a single copy when they share the same data type, since the copy of such
+    small tensors is dominated by the per-transfer overhead.
+
+    Parameters
+    ----------
+    tensors : dict[str, Tensor]
+        The tensors.
+    device : Framework-specific device context object
+        The target device.
+    kwargs : Key-word arguments.
+        Key-word arguments fed to the framework copy function.
+
+    Returns
+    -------
+    dict[str, Tensor]
+        The tensors on the target device.
+    """
+    ret = dict(tensors)
+    keys = [k for k, t in tensors.items() if F.context(t) != device]
+    if len(keys) == 1 or len(set(F.dtype(tensors[k]) for k in keys)) > 1:
+        for k in keys:
+            ret[k] = F.copy_to(tensors[k], device, **kwargs)
+    elif len(keys) > 1:
+        packed = F.copy_to(F.cat([tensors[k] for k in keys], 0), device, **kwargs)
+        parts = F.split(packed, [F.shape(tensors[k])[0] for k in keys], 0)
+        ret.update(zip(keys, parts))
+    return ret
+
+def _mask_ids(ids, mask, ids_owned):
+    """Return the IDs whose mask entries are True.
+
+    If the mask selects all or none of the IDs, the result is returned without
+    launching the compaction kernel.
+
+    Parameters
+    ----------
+    ids : Tensor
+        The ID tensor.
+    mask : Tensor
+        The mask of the same length. Nonzero entries select the IDs.
+    ids_owned : bool
+        Whether :attr:`ids` is created internally and thus can be returned as is.
+        Otherwise it may be the tensor given by the user.
+
+    Returns
+    -------
+    Tensor
+        The selected IDs.
+    """
+    # the count and the compaction must agree on what is selected, so both use
+    # the same boolean view of the mask
+    mask = F.logical_not(F.equal(mask, 0))
+    num_selected = F.as_scalar(F.sum(F.astype(mask, F.int64), 0))
+    if num_selected == len(ids) and ids_owned:
+        return ids
+    if num_selected == 0:
+        return F.narrow_row(ids, 0, 0)
+    # one fused kernel, unlike nonzero followed by a gather
+    return F.boolean_mask(ids, mask)
+
+def _reduced_storage(frame, reduce_func):
+    """Return the storage of the column written by a builtin reducer, or None."""
+    if not core.is_builtin(reduce_func):
+        return None
+    col = frame._columns.get(reduce_func.out_field, None)
+    return None if col is None else col.storage
+
+def _can_write_inplace(frame, produced, reduce_func, apply_node_func):
+    """Return whether the results of a message passing step can be written into
+    the existing node feature storage.
+
+    Only builtin reducers qualify since their output field is fixed across steps.
+    The column must still hold the storage ``produced`` by the previous step of the
+    same propagation, so tensors the user assigned or read before the propagation
+    started are never written. The write must also happen outside autograd.
+    """
+    if produced is None or apply_node_func is not None or not core.is_builtin(reduce_func):
+        return False
+    if _reduced_storage(frame, reduce_func) is not produced:
+        return False
+    try:
+        return not F.is_recording()
+    except NotImplementedError:
+        # the backend cannot tell, so it probably cannot write in place either
+        return False
+
 def _create_compute_graph(graph, u, v, eid, recv_nodes=None):
     """Create a computation graph from the given edges.
 
@@ -6089,14 +6581,13 @@ def _create_compute_graph(graph, u, v, eid, recv_nodes=None):
         # an empty graph to continue.
         unique_src = new_u = new_v = u
         assert recv_nodes is not None
-        unique_dst, _ = utils.relabel(recv_nodes)
+        unique_dst, _ = utils.relabel(recv_nodes, graph.number_of_dst_nodes())
     else:
-        # relabel u and v to starting from 0
-        unique_src, src_map = utils.relabel(u)
-        if recv_nodes is None:
-            unique_dst, dst_map = utils.relabel(v)
-        else:
-            unique_dst, dst_map = utils.relabel(recv_nodes)
+        # relabel u and v to starting from 0; the node counts let small graphs
+        # (e.g., the frontiers of prop_nodes) use the dense path instead of sorting
+        unique_src, src_map = utils.relabel(u, graph.number_of_src_nodes())
+        unique_dst, dst_map = utils.relabel(
+            v if recv_nodes is None else recv_nodes, graph.number_of_dst_nodes())
         new_u = F.gather_row(src_map, u)
         new_v = F.gather_row(dst_map, v)
 
@@ -6104,10 +6595,11 @@ def _create_compute_graph(graph, u, v, eid, recv_nodes=None):
     # create graph
     hgidx = heterograph_index.create_unitgraph_from_coo(
         2, len(unique_src), len(unique_dst), new_u, new_v, ['coo', 'csr', 'csc'])
-    # create frame
-    srcframe = graph._node_frames[graph.get_ntype_id(srctype)].subframe(unique_src)
+    # create frame; the graph has a single relation, so its endpoint types are
+    # looked up directly in the SRC/DST type maps
+    srcframe = graph._node_frames[graph._srctypes_invmap[srctype]].subframe(unique_src)
     srcframe[NID] = unique_src
-    dstframe = graph._node_frames[graph.get_ntype_id(dsttype)].subframe(unique_dst)
+    dstframe = graph._node_frames[graph._dsttypes_invmap[dsttype]].subframe(unique_dst)
     dstframe[NID] = unique_dst
     eframe = graph._edge_frames[0].subframe(eid)
     eframe[EID] = eid
@@ -165,7 +165,10 @@ class HeteroGraphIndex(ObjectBase):
         DGLDataType
             The data type of the graph.
         """
-        return _CAPI_DGLHeteroDataType(self)
+        # The data type never changes for a graph index, so query the C API only once.
+        if 'dtype' not in self._cache:
+            self._cache['dtype'] = _CAPI_DGLHeteroDataType(self)
+        return self._cache['dtype']
 
     @property
     def ctx(self):
@@ -5,10 +5,12 @@ import time
 from enum import Enum
 from collections import namedtuple
 
+import numpy as np
+
 import dgl.backend as F
 from ._ffi.function import _init_api
+from . import ndarray as nd
 from ._deprecate.nodeflow import NodeFlow
-from . import utils
 
 _init_api("dgl.network")
 
@@ -135,8 +137,10 @@ def _send_nodeflow(sender, nodeflow, recv_id):
     gidx = nodeflow._graph
     node_mapping = nodeflow._node_mapping.todgltensor()
     edge_mapping = nodeflow._edge_mapping.todgltensor()
-    layers_offsets = utils.toindex(nodeflow._layer_offsets).todgltensor()
-    flows_offsets = utils.toindex(nodeflow._block_offsets).todgltensor()
+    # the offsets are small numpy arrays; copy them into NDArrays directly instead of
+    # going through an Index and a framework tensor
+    layers_offsets = nd.array(np.asarray(nodeflow._layer_offsets, dtype=np.int64))
+    flows_offsets = nd.array(np.asarray(nodeflow._block_offsets, dtype=np.int64))
     _CAPI_SenderSendNodeFlow(sender,
                              int(recv_id),
                              gidx,
@@ -170,34 +170,51 @@ class EdgeConv(nn.Module):
                                    'suppress the check and let the code run.')
 
             h_src, h_dst = expand_as_pair(feat, g)
-            g.srcdata['x'] = h_src
-            g.dstdata['x'] = h_dst
-            g.apply_edges(fn.v_sub_u('x', 'x', 'theta'))
-            g.edata['theta'] = self.theta(g.edata['theta'])
-            g.dstdata['phi'] = self.phi(g.dstdata['x'])
-            if not self.batch_norm:
-                g.update_all(fn.e_add_v('theta', 'phi', 'e'), fn.max('e', 'x'))
+            # The message is Theta applied on the destination feature minus the source
+            # feature, i.e., Theta(h_i - h_j) = W h_i - W h_j + b. Theta is applied on
+            # the nodes instead of on the difference of every edge. Calling the module
+            # keeps its hooks (e.g., weight normalization) in effect; the biases of the
+            # two calls cancel out, so the bias is added back once, and the terms of the
+            # destination node are folded into 'phi'.
+            theta_src = self.theta(h_src)
+            if isinstance(feat, tuple):
+                theta_dst = self.theta(h_dst)
             else:
-                g.apply_edges(fn.e_add_v('theta', 'phi', 'e'))
-                # Although the official implementation includes a per-edge
-                # batch norm within EdgeConv, I choose to replace it with a
-                # global batch norm for a number of reasons:
-                #
-                # (1) When the point clouds within each batch do not have the
-                #     same number of points, batch norm would not work.
-                #
-                # (2) Even if the point clouds always have the same number of
-                #     points, the points may as well be shuffled even with the
-                #     same (type of) object (and the official implementation
-                #     *does* shuffle the points of the same example for each
-                #     epoch).
-                #
-                #     For example, the first point of a point cloud of an
-                #     airplane does not always necessarily reside at its nose.
-                #
-                #     In this case, the learned statistics of each position
-                #     by batch norm is not as meaningful as those learned from
-                #     images.
-                g.edata['e'] = self.bn(g.edata['e'])
-                g.update_all(fn.copy_e('e', 'e'), fn.max('e', 'x'))
+                theta_dst = theta_src[:g.number_of_dst_nodes()]
+            g.srcdata['theta'] = -theta_src
+            phi = self.phi(h_dst) + theta_dst
+            if self.theta.bias is not None:
+                phi = phi + self.theta.bias
+            g.dstdata['phi'] = phi
+            if not self.batch_norm:
+                # The destination terms do not depend on the edge, so they are added
+                # after the maximum over the source terms.
+                g.update_all(fn.copy_u('theta', 'e'), fn.max('e', 'x'))
+                rst = g.dstdata['x'] + g.dstdata['phi']
+                if self._allow_zero_in_degree:
+                    # nodes without in-edges keep the zero output of the max reducer
+                    rst = rst * (g.in_degrees() > 0).unsqueeze(-1).to(rst)
+                return rst
+            g.apply_edges(fn.u_add_v('theta', 'phi', 'e'))
+            # Although the official implementation includes a per-edge
+            # batch norm within EdgeConv, I choose to replace it with a
+            # global batch norm for a number of reasons:
+            #
+            # (1) When the point clouds within each batch do not have the
+            #     same number of points, batch norm would not work.
+            #
+            # (2) Even if the point clouds always have the same number of
+            #     points, the points may as well be shuffled even with the
+            #     same (type of) object (and the official implementation
+            #     *does* shuffle the points of the same example for each
+            #     epoch).
+            #
+            #     For example, the first point of a point cloud of an
+            #     airplane does not always necessarily reside at its nose.
+            #
+            #     In this case, the learned statistics of each position
+            #     by batch norm is not as meaningful as those learned from
+            #     images.
+            g.edata['e'] = self.bn(g.edata['e'])
+            g.update_all(fn.copy_e('e', 'e'), fn.max('e', 'x'))
             return g.dstdata['x']
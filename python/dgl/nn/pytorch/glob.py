@@ -6,8 +6,8 @@ import numpy as np
 
 from ...backend import pytorch as F
 from ...base import dgl_warning
-from ...readout import sum_nodes, mean_nodes, max_nodes, broadcast_nodes,\
-    softmax_nodes, topk_nodes
+from ...readout import sum_nodes, mean_nodes, max_nodes, softmax_nodes, topk_nodes
+from ...ops import segment_reduce, segment_softmax
 
 
 __all__ = ['SumPooling', 'AvgPooling', 'MaxPooling', 'SortPooling',
@@ -355,13 +355,15 @@ class SortPooling(nn.Module):
             to the batch size of input graphs.
         """
         with graph.local_scope():
-            # Sort the feature of each node in ascending order.
-            feat, _ = feat.sort(dim=-1)
-            graph.ndata['h'] = feat
-            # Sort nodes according to their last features.
-            ret = topk_nodes(graph, 'h', self.k, sortby=-1)[0].view(
-                -1, self.k * feat.shape[-1])
-            return ret
+            # Nodes are ranked by the last entry of their sorted features, i.e. their
+            # maximum, so only the k selected nodes per graph need a full sort. The
+            # maximum is appended as the ranking key and dropped after the top-k.
+            key, _ = feat.max(dim=-1, keepdim=True)
+            graph.ndata['h'] = th.cat([feat, key], dim=-1)
+            ret = topk_nodes(graph, 'h', self.k, sortby=-1)[0][..., :-1]
+            # Sort the feature of each selected node in ascending order.
+            ret, _ = ret.sort(dim=-1)
+            return ret.reshape(-1, self.k * feat.shape[-1])
 
 
 class GlobalAttentionPooling(nn.Module):
@@ -583,25 +585,28 @@ class Set2Set(nn.Module):
             The output feature with shape :math:`(B, D)`, where :math:`B` refers to
             the batch size, and :math:`D` means the size of features.
         """
-        with graph.local_scope():
-            batch_size = graph.batch_size
+        batch_size = graph.batch_size
+        # The per-graph node counts are the segments of every readout below, so the
+        # attention and the weighted sum run on them directly without going through
+        # the node data of the graph.
+        seglen = graph.batch_num_nodes()
+        # graph ID of every node, to broadcast the graph-level queries to the nodes
+        node_graph_ids = th.arange(batch_size, device=seglen.device).repeat_interleave(seglen)
 
-            h = (feat.new_zeros((self.n_layers, batch_size, self.input_dim)),
-                 feat.new_zeros((self.n_layers, batch_size, self.input_dim)))
+        h = (feat.new_zeros((self.n_layers, batch_size, self.input_dim)),
+             feat.new_zeros((self.n_layers, batch_size, self.input_dim)))
 
-            q_star = feat.new_zeros(batch_size, self.output_dim)
+        q_star = feat.new_zeros(batch_size, self.output_dim)
 
-            for _ in range(self.n_iters):
-                q, h = self.lstm(q_star.unsqueeze(0), h)
-                q = q.view(batch_size, self.input_dim)
-                e = (feat * broadcast_nodes(graph, q)).sum(dim=-1, keepdim=True)
-                graph.ndata['e'] = e
-                alpha = softmax_nodes(graph, 'e')
-                graph.ndata['r'] = feat * alpha
-                readout = sum_nodes(graph, 'r')
-                q_star = th.cat([q, readout], dim=-1)
+        for _ in range(self.n_iters):
+            q, h = self.lstm(q_star.unsqueeze(0), h)
+            q = q.view(batch_size, self.input_dim)
+            e = (feat * q[node_graph_ids]).sum(dim=-1, keepdim=True)
+            alpha = segment_softmax(seglen, e)
+            readout = segment_reduce(seglen, feat * alpha, reducer='sum')
+            q_star = th.cat([q, readout], dim=-1)
 
-            return q_star
+        return q_star
 
     def extra_repr(self):
         """Set the extra representation of the module.
@@ -709,17 +714,22 @@ class MultiHeadAttention(nn.Module):
         max_len_x = max(lengths_x)
         max_len_mem = max(lengths_mem)
         device = x.device
+        self_attention = mem is x and lengths_mem is lengths_x
         lengths_x = th.tensor(lengths_x, dtype=th.int64, device=device)
         lengths_mem = th.tensor(lengths_mem, dtype=th.int64, device=device)
 
-        queries = self.proj_q(x).view(-1, self.num_heads, self.d_head)
-        keys = self.proj_k(mem).view(-1, self.num_heads, self.d_head)
-        values = self.proj_v(mem).view(-1, self.num_heads, self.d_head)
-
-        # padding to (B, max_len_x/mem, num_heads, d_head)
-        queries = F.pad_packed_tensor(queries, lengths_x, 0)
-        keys = F.pad_packed_tensor(keys, lengths_mem, 0)
-        values = F.pad_packed_tensor(values, lengths_mem, 0)
+        # Projections of the same input share one matmul over the concatenated weights
+        # and are padded together to (B, max_len_x/mem, num_heads, d_head).
+        if self_attention:
+            weight = th.cat([self.proj_q.weight, self.proj_k.weight, self.proj_v.weight], 0)
+            qkv = nn.functional.linear(x, weight).view(-1, 3, self.num_heads, self.d_head)
+            queries, keys, values = F.pad_packed_tensor(qkv, lengths_x, 0).unbind(2)
+        else:
+            queries = self.proj_q(x).view(-1, self.num_heads, self.d_head)
+            queries = F.pad_packed_tensor(queries, lengths_x, 0)
+            weight = th.cat([self.proj_k.weight, self.proj_v.weight], 0)
+            kv = nn.functional.linear(mem, weight).view(-1, 2, self.num_heads, self.d_head)
+            keys, values = F.pad_packed_tensor(kv, lengths_mem, 0).unbind(2)
 
         # attention score with shape (B, num_heads, max_len_x, max_len_mem)
         e = th.einsum('bxhd,byhd->bhxy', queries, keys)
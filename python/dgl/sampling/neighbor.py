@@ -121,12 +121,10 @@ def sample_neighbors(g, nodes, fanout, edge_dir='in', prob=None, replace=False,
         nodes = {g.ntypes[0] : nodes}
 
     nodes = utils.prepare_tensor_dict(g, nodes, 'nodes')
-    nodes_all_types = []
-    for ntype in g.ntypes:
-        if ntype in nodes:
-            nodes_all_types.append(F.to_dgl_nd(nodes[ntype]))
-        else:
-            nodes_all_types.append(nd.array([], ctx=nd.cpu()))
+    # node types without seed nodes share one empty array
+    empty = nd.array([], ctx=nd.cpu())
+    nodes_all_types = [F.to_dgl_nd(nodes[ntype]) if ntype in nodes else empty
+                       for ntype in g.ntypes]
 
     if isinstance(fanout, nd.NDArray):
         fanout_array = fanout
@@ -146,14 +144,11 @@ def sample_neighbors(g, nodes, fanout, edge_dir='in', prob=None, replace=False,
             isinstance(prob[0], nd.NDArray):
         prob_arrays = prob
     elif prob is None:
-        prob_arrays = [nd.array([], ctx=nd.cpu())] * len(g.etypes)
+        prob_arrays = [empty] * len(g.etypes)
     else:
-        prob_arrays = []
-        for etype in g.canonical_etypes:
-            if prob in g.edges[etype].data:
-                prob_arrays.append(F.to_dgl_nd(g.edges[etype].data[prob]))
-            else:
-                prob_arrays.append(nd.array([], ctx=nd.cpu()))
+        # read the edge frames directly; they are ordered by edge type ID
+        prob_arrays = [F.to_dgl_nd(frame[prob]) if prob in frame else empty
+                       for frame in g._edge_frames]
 
     subgidx = _CAPI_DGLSampleNeighbors(g._graph, nodes_all_types, fanout_array,
                                        edge_dir, prob_arrays, replace)
@@ -269,12 +264,10 @@ def select_topk(g, k, weight, nodes=None, edge_dir='in', ascending=False,
 
     # Parse nodes into a list of NDArrays.
     nodes = utils.prepare_tensor_dict(g, nodes, 'nodes')
-    nodes_all_types = []
-    for ntype in g.ntypes:
-        if ntype in nodes:
-            nodes_all_types.append(F.to_dgl_nd(nodes[ntype]))
-        else:
-            nodes_all_types.append(nd.array([], ctx=nd.cpu()))
+    # node types without seed nodes share one empty array
+    empty = nd.array([], ctx=nd.cpu())
+    nodes_all_types = [F.to_dgl_nd(nodes[ntype]) if ntype in nodes else empty
+                       for ntype in g.ntypes]
 
     if not isinstance(k, dict):
         k_array = [int(k)] * len(g.etypes)
@@ -288,9 +281,9 @@ def select_topk(g, k, weight, nodes=None, edge_dir='in', ascending=False,
     k_array = F.to_dgl_nd(F.tensor(k_array, dtype=F.int64))
 
     weight_arrays = []
-    for etype in g.canonical_etypes:
-        if weight in g.edges[etype].data:
-            weight_arrays.append(F.to_dgl_nd(g.edges[etype].data[weight]))
+    for etype, frame in zip(g.canonical_etypes, g._edge_frames):
+        if weight in frame:
+            weight_arrays.append(F.to_dgl_nd(frame[weight]))
         else:
             raise DGLError('Edge weights "{}" do not exist for relation graph "{}".'.format(
                 weight, etype))
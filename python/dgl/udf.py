@@ -12,12 +12,14 @@ class EdgeBatch(object):
         Edge IDs.
     etype : (str, str, str)
         Edge type.
-    src_data : dict[str, Tensor]
-        Src node features.
+    src_data : dict[str, Tensor] or callable
+        Src node features. If callable, it is called without arguments the first
+        time the source features are accessed.
     edge_data : dict[str, Tensor]
         Edge features.
-    dst_data : dict[str, Tensor]
-        Dst node features.
+    dst_data : dict[str, Tensor] or callable
+        Dst node features. If callable, it is called without arguments the first
+        time the destination features are accessed.
     """
     def __init__(self, graph, eid, etype, src_data, edge_data, dst_data):
         self._graph = graph
@@ -62,6 +64,8 @@ class EdgeBatch(object):
         tensor([[1.],
                 [2.]])
         """
+        if callable(self._src_data):
+            self._src_data = self._src_data()
         return self._src_data
 
     @property
@@ -99,6 +103,8 @@ class EdgeBatch(object):
         tensor([[0.],
                 [2.]])
         """
+        if callable(self._dst_data):
+            self._dst_data = self._dst_data()
         return self._dst_data
 
     @property
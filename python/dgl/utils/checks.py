@@ -166,3 +166,23 @@ def check_valid_idtype(idtype):
     if idtype not in [None, F.int32, F.int64]:
         raise DGLError('Expect idtype to be a framework object of int32/int64, '
                        'got {}'.format(idtype))
+
+def validate_id_tensor(ids, bound, name):
+    """Check that all the IDs in an ID tensor are in the range ``[0, bound)``.
+
+    The IDs are integers, so the whole check reduces to their minimum and maximum.
+
+    Parameters
+    ----------
+    ids : Tensor
+        1D ID tensor.
+    bound : int
+        The number of valid IDs.
+    name : str
+        Name of the argument, used in the error message.
+    """
+    if F.shape(ids)[0] == 0:
+        return
+    if F.as_scalar(F.min(ids, 0)) < 0 or F.as_scalar(F.max(ids, 0)) >= bound:
+        raise DGLError('{} contains invalid IDs. Expect all of them to be in the'
+                       ' range [0, {}).'.format(name, bound))
@@ -715,7 +715,32 @@ def compensate(ids, origin_ids):
                          F.full_1d(len(ids), 0, F.dtype(ids), F.context(ids)))
     return F.tensor(F.nonzero_1d(mask), dtype=F.dtype(ids))
 
-def relabel(x):
+def unique_small_range(x, num_total):
+    """Return the unique values of an ID tensor whose values are within
+    ``[0, num_total)``.
+
+    Instead of sorting the input, the function marks the occurring IDs in a dense
+    mask of length ``num_total`` and then compacts the mask. This is cheaper than
+    :func:`F.unique` when ``num_total`` is small compared with the length of ``x``.
+
+    Parameters
+    ----------
+    x : Tensor
+        ID tensor.
+    num_total : int
+        Upper bound (exclusive) of the IDs in ``x``.
+
+    Returns
+    -------
+    Tensor
+        The unique IDs in ascending order. It has the same data type and context as ``x``.
+    """
+    ctx = F.context(x)
+    mask = F.zeros((num_total,), dtype=F.int8, ctx=ctx)
+    mask = F.scatter_row(mask, x, F.ones((len(x),), dtype=F.int8, ctx=ctx))
+    return F.astype(F.nonzero_1d(mask), F.dtype(x))
+
+def relabel(x, num_total=None):
     """Relabel the input ids to continuous ids that starts from zero.
 
     Ids are assigned new ids according to their ascending order.
@@ -735,18 +760,27 @@ def relabel(x):
     ----------
     x : Tensor
         ID tensor.
+    num_total : int, optional
+        Upper bound (exclusive) of the IDs in ``x``. If given and small compared
+        with the length of ``x``, the unique IDs are found by :func:`unique_small_range`
+        instead of sorting.
 
     Returns
     -------
     new_to_old : Tensor
         The mapping from new id to old id.
     old_to_new : Tensor
-        The mapping from old id to new id. It is a vector of length MAX(x).
+        The mapping from old id to new id. It is a vector of length MAX(x)
+        (or ``num_total`` if the dense path is taken).
         One can use advanced indexing to convert an old id tensor to a
         new id tensor: new_id = old_to_new[old_id]
     """
-    unique_x = F.unique(x)
-    map_len = F.as_scalar(F.max(unique_x, dim=0)) + 1
+    if num_total is not None and num_total < 4 * len(x):
+        unique_x = unique_small_range(x, num_total)
+        map_len = num_total
+    else:
+        unique_x = F.unique(x)
+        map_len = F.as_scalar(F.max(unique_x, dim=0)) + 1
     ctx = F.context(x)
     dtype = F.dtype(x)
     old_to_new = F.zeros((map_len,), dtype=dtype, ctx=ctx)
@@ -58,12 +58,12 @@ class HeteroNodeDataView(MutableMapping):
         if isinstance(self._ntype, list):
             ret = {}
             for (i, ntype) in enumerate(self._ntype):
-                value = self._graph._get_n_repr(self._ntid[i], self._nodes).get(key, None)
+                value = self._graph._get_n_repr(self._ntid[i], self._nodes, [key]).get(key, None)
                 if value is not None:
                     ret[ntype] = value
             return ret
         else:
-            return self._graph._get_n_repr(self._ntid, self._nodes)[key]
+            return self._graph._get_n_repr(self._ntid, self._nodes, [key])[key]
 
     def __setitem__(self, key, val):
         if isinstance(self._ntype, list):
@@ -173,12 +173,12 @@ class HeteroEdgeDataView(MutableMapping):
         if isinstance(self._etype, list):
             ret = {}
             for (i, etype) in enumerate(self._etype):
-                value = self._graph._get_e_repr(self._etid[i], self._edges).get(key, None)
+                value = self._graph._get_e_repr(self._etid[i], self._edges, [key]).get(key, None)
                 if value is not None:
                     ret[etype] = value
             return ret
         else:
-            return self._graph._get_e_repr(self._etid, self._edges)[key]
+            return self._graph._get_e_repr(self._etid, self._edges, [key])[key]
 
     def __setitem__(self, key, val):
         if isinstance(self._etype, list):
@@ -497,6 +497,14 @@ def test_local_var(idtype):
     foo(g)
     assert 'hh' not in g.ndata
     assert 'ww' not in g.edata
+    # test out-place update of the original graph
+    lg = g.local_var()
+    g.nodes[[2, 3]].data['h'] = F.ones((2, 3))
+    g.edges[[2, 3]].data['w'] = F.ones((2, 4))
+    assert F.allclose(lg.ndata['h'], F.zeros((g.number_of_nodes(), 3)))
+    assert F.allclose(lg.edata['w'], F.zeros((g.number_of_edges(), 4)))
+    g.ndata['h'] = F.zeros((g.number_of_nodes(), 3))
+    g.edata['w'] = F.zeros((g.number_of_edges(), 4))
 
     # test initializer1
     g = dgl.graph(([0, 1], [1, 1]), idtype=idtype, device=F.ctx())
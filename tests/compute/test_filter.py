@@ -1,6 +1,9 @@
 import dgl
 import backend as F
 import numpy as np
+import pytest
+from dgl import DGLError
+from utils import check_fail
 
 def test_filter():
     g = dgl.DGLGraph().to(F.ctx())
@@ -36,6 +39,42 @@ def test_filter():
     e_idx = g.filter_edges(predicate, [0, 1])
     assert set(F.zerocopy_to_numpy(e_idx)) == {1}
 
+    # out-of-range node IDs
+    assert check_fail(g.filter_nodes, predicate, [0, 4])
+    assert check_fail(g.filter_edges, predicate, ([0, 4], [1, 0]))
+    assert check_fail(g.filter_edges, predicate, ([0, 1], [1, -1]))
+
+    # any nonzero value of a non-boolean mask selects the ID
+    def float_predicate(r):
+        return F.max(r.data['a'], 1) * 0.5
+    def int_predicate(r):
+        return F.astype(F.max(r.data['a'], 1), F.int64) * 2
+    for pred in [float_predicate, int_predicate]:
+        assert set(F.zerocopy_to_numpy(g.filter_nodes(pred))) == {1, 3}
+        assert set(F.zerocopy_to_numpy(g.filter_edges(pred))) == {1, 3}
+        assert set(F.zerocopy_to_numpy(g.filter_nodes(pred, [0, 1]))) == {1}
+
+    # the predicate must return one value per node/edge
+    def bad_predicate(r):
+        return F.max(r.data['a'], 1)[:-1] > 0
+    with pytest.raises(DGLError):
+        g.filter_nodes(bad_predicate)
+    with pytest.raises(DGLError):
+        g.filter_nodes(bad_predicate, [0, 1])
+    with pytest.raises(DGLError):
+        g.filter_edges(bad_predicate)
+    with pytest.raises(DGLError):
+        g.filter_edges(bad_predicate, [0, 1])
+
+    # filtering the whole graph returns int64 IDs, subsets follow the ID type
+    g = dgl.graph(([0, 1, 2, 3], [1, 2, 3, 0]), idtype=F.int32, device=F.ctx())
+    g.ndata['a'] = n_repr
+    g.edata['a'] = e_repr
+    assert F.dtype(g.filter_nodes(predicate)) == F.int64
+    assert F.dtype(g.filter_edges(predicate)) == F.int64
+    assert F.dtype(g.filter_nodes(predicate, [0, 1])) == F.int32
+    assert F.dtype(g.filter_edges(predicate, [0, 1])) == F.int32
+
 
 if __name__ == '__main__':
     test_filter()
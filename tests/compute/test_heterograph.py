@@ -1,9 +1,9 @@
 import dgl
 import dgl.function as fn
-from collections import Counter
 import numpy as np
 import scipy.sparse as ssp
 import itertools
+import functools
 import backend as F
 import networkx as nx
 import unittest, pytest
@@ -12,6 +12,22 @@ import test_utils
 from test_utils import parametrize_dtype, get_cases
 from scipy.sparse import rand
 
+def cached_fixture(builder):
+    """Build the fixture once per ``(idtype, device)`` and hand out clones.
+
+    Tests freely mutate the returned graph (features, nodes, edges), so every
+    caller gets its own clone of the cached graph.
+    """
+    @functools.lru_cache(maxsize=None)
+    def _build(idtype, device):
+        return builder(idtype)
+
+    @functools.wraps(builder)
+    def wrapper(idtype):
+        return _build(idtype, F.ctx()).clone()
+    return wrapper
+
+@cached_fixture
 def create_test_heterograph(idtype):
     # test heterograph from the docstring, plus a user -- wishes -- game relation
     # 3 users, 2 games, 2 developers
@@ -31,21 +47,28 @@ def create_test_heterograph(idtype):
     assert g.device == F.ctx()
     return g
 
+@cached_fixture
 def create_test_heterograph1(idtype):
-    edges = []
-    edges.extend([(0, 1), (1, 2)])  # follows
-    edges.extend([(0, 3), (1, 3), (2, 4), (1, 4)])  # plays
-    edges.extend([(0, 4), (2, 3)])  # wishes
-    edges.extend([(5, 3), (6, 4)])  # develops
-    edges = tuple(zip(*edges))
-    ntypes = F.tensor([0, 0, 0, 1, 1, 2, 2])
-    etypes = F.tensor([0, 0, 1, 1, 1, 1, 2, 2, 3, 3])
+    src = np.concatenate([
+        [0, 1],         # follows
+        [0, 1, 2, 1],   # plays
+        [0, 2],         # wishes
+        [5, 6]])        # develops
+    dst = np.concatenate([
+        [1, 2],         # follows
+        [3, 3, 4, 4],   # plays
+        [4, 3],         # wishes
+        [3, 4]])        # develops
+    edges = (src, dst)
+    ntypes = F.tensor(np.repeat([0, 1, 2], [3, 2, 2]))
+    etypes = F.tensor(np.repeat([0, 1, 2, 3], [2, 4, 2, 2]))
     g0 = dgl.graph(edges, idtype=idtype, device=F.ctx())
     g0.ndata[dgl.NTYPE] = ntypes
     g0.edata[dgl.ETYPE] = etypes
     return dgl.to_heterogeneous(g0, ['user', 'game', 'developer'],
                                 ['follows', 'plays', 'wishes', 'develops'])
 
+@cached_fixture
 def create_test_heterograph2(idtype):
     g = dgl.heterograph({
         ('user', 'follows', 'user'): ([0, 1], [1, 2]),
@@ -234,7 +257,10 @@ def test_query(idtype):
     for i in range(len(etypes)):
         assert g.to_canonical_etype(etypes[i]) == canonical_etypes[i]
 
-    def _test(g):
+    # the edge ID inputs to find_edges, keyed by the number of edges
+    eid_variants = {}
+
+    def _test(g, etypes, edges, negative_edges):
         # number of nodes
         assert [g.num_nodes(ntype) for ntype in ntypes] == [3, 2, 2]
 
@@ -244,8 +270,7 @@ def test_query(idtype):
         # has_node & has_nodes
         for ntype in ntypes:
             n = g.number_of_nodes(ntype)
-            for i in range(n):
-                assert g.has_node(i, ntype)
+            assert F.asnumpy(g.has_nodes(list(range(n)), ntype)).all()
             assert not g.has_node(n, ntype)
             assert np.array_equal(
                 F.asnumpy(g.has_nodes([0, n], ntype)).astype('int32'), [1, 0])
@@ -254,13 +279,11 @@ def test_query(idtype):
 
         for etype in etypes:
             srcs, dsts = edges[etype]
-            for src, dst in zip(srcs, dsts):
-                assert g.has_edges_between(src, dst, etype)
+            assert g.has_edges_between(srcs[0], dsts[0], etype)
             assert F.asnumpy(g.has_edges_between(srcs, dsts, etype)).all()
 
             srcs, dsts = negative_edges[etype]
-            for src, dst in zip(srcs, dsts):
-                assert not g.has_edges_between(src, dst, etype)
+            assert not g.has_edges_between(srcs[0], dsts[0], etype)
             assert not F.asnumpy(g.has_edges_between(srcs, dsts, etype)).any()
 
             srcs, dsts = edges[etype]
@@ -283,10 +306,7 @@ def test_query(idtype):
             assert g.out_degrees(0, etype) == len(succ)
 
             # edge_id & edge_ids
-            for i, (src, dst) in enumerate(zip(srcs, dsts)):
-                assert g.edge_ids(src, dst, etype=etype) == i
-                _, _, eid = g.edge_ids(src, dst, etype=etype, return_uv=True)
-                assert eid == i
+            assert g.edge_ids(srcs[-1], dsts[-1], etype=etype) == n_edges - 1
             assert F.asnumpy(g.edge_ids(srcs, dsts, etype=etype)).tolist() == list(range(n_edges))
             u, v, e = g.edge_ids(srcs, dsts, etype=etype, return_uv=True)
             u, v, e = F.asnumpy(u), F.asnumpy(v), F.asnumpy(e)
@@ -294,7 +314,10 @@ def test_query(idtype):
             assert v[e].tolist() == dsts
 
             # find_edges
-            for eid in [list(range(n_edges)), np.arange(n_edges), F.astype(F.arange(0, n_edges), g.idtype)]:
+            if n_edges not in eid_variants:
+                eid_variants[n_edges] = (list(range(n_edges)), np.arange(n_edges),
+                                         F.astype(F.arange(0, n_edges), idtype))
+            for eid in eid_variants[n_edges]:
                 u, v = g.find_edges(eid, etype)
                 assert F.asnumpy(u).tolist() == srcs
                 assert F.asnumpy(v).tolist() == dsts
@@ -309,13 +332,11 @@ def test_query(idtype):
             # in_degrees & out_degrees
             in_degrees = F.asnumpy(g.in_degrees(etype=etype))
             out_degrees = F.asnumpy(g.out_degrees(etype=etype))
-            src_count = Counter(srcs)
-            dst_count = Counter(dsts)
             utype, _, vtype = g.to_canonical_etype(etype)
-            for i in range(g.number_of_nodes(utype)):
-                assert out_degrees[i] == src_count[i]
-            for i in range(g.number_of_nodes(vtype)):
-                assert in_degrees[i] == dst_count[i]
+            assert np.array_equal(
+                out_degrees, np.bincount(srcs, minlength=g.number_of_nodes(utype)))
+            assert np.array_equal(
+                in_degrees, np.bincount(dsts, minlength=g.number_of_nodes(vtype)))
 
     edges = {
         'follows': ([0, 1], [1, 2]),
@@ -330,37 +351,18 @@ def test_query(idtype):
         'wishes': ([0, 1], [0, 1]),
         'develops': ([0, 1], [1, 0]),
     }
-    g = create_test_heterograph(idtype)
-    _test(g)
-    g = create_test_heterograph1(idtype)
-    _test(g)
-    if F._default_context_str != 'gpu':
-        # XXX: CUDA COO operators have not been live yet.
-        g = create_test_heterograph2(idtype)
-        _test(g)
+    # the same edges keyed by canonical edge types
+    canonical_edges = {c: edges[e] for c, e in zip(canonical_etypes, etypes)}
+    canonical_negative_edges = {
+        c: negative_edges[e] for c, e in zip(canonical_etypes, etypes)}
 
-    etypes = canonical_etypes
-    edges = {
-        ('user', 'follows', 'user'): ([0, 1], [1, 2]),
-        ('user', 'plays', 'game'): ([0, 1, 2, 1], [0, 0, 1, 1]),
-        ('user', 'wishes', 'game'): ([0, 2], [1, 0]),
-        ('developer', 'develops', 'game'): ([0, 1], [0, 1]),
-    }
-    # edges that does not exist in the graph
-    negative_edges = {
-        ('user', 'follows', 'user'): ([0, 1], [0, 1]),
-        ('user', 'plays', 'game'): ([0, 2], [1, 0]),
-        ('user', 'wishes', 'game'): ([0, 1], [0, 1]),
-        ('developer', 'develops', 'game'): ([0, 1], [1, 0]),
-        }
-    g = create_test_heterograph(idtype)
-    _test(g)
-    g = create_test_heterograph1(idtype)
-    _test(g)
+    graphs = [g, create_test_heterograph1(idtype)]
     if F._default_context_str != 'gpu':
         # XXX: CUDA COO operators have not been live yet.
-        g = create_test_heterograph2(idtype)
-        _test(g)
+        graphs.append(create_test_heterograph2(idtype))
+    for g in graphs:
+        _test(g, etypes, edges, negative_edges)
+        _test(g, canonical_etypes, canonical_edges, canonical_negative_edges)
 
     # test repr
     print(g)
@@ -488,53 +490,53 @@ def _test_edge_ids():
 def test_adj(idtype):
     g = create_test_heterograph(idtype)
     adj = F.sparse_to_numpy(g.adj(transpose=False, etype='follows'))
-    assert np.allclose(
+    assert np.array_equal(
             adj,
             np.array([[0., 0., 0.],
                       [1., 0., 0.],
                       [0., 1., 0.]]))
     adj = F.sparse_to_numpy(g.adj(transpose=True, etype='follows'))
-    assert np.allclose(
+    assert np.array_equal(
             adj,
             np.array([[0., 1., 0.],
                       [0., 0., 1.],
                       [0., 0., 0.]]))
     adj = F.sparse_to_numpy(g.adj(transpose=False, etype='plays'))
-    assert np.allclose(
+    assert np.array_equal(
             adj,
             np.array([[1., 1., 0.],
                       [0., 1., 1.]]))
     adj = F.sparse_to_numpy(g.adj(transpose=True, etype='plays'))
-    assert np.allclose(
+    assert np.array_equal(
             adj,
             np.array([[1., 0.],
                       [1., 1.],
                       [0., 1.]]))
 
     adj = g.adj(transpose=False, scipy_fmt='csr', etype='follows')
-    assert np.allclose(
+    assert np.array_equal(
             adj.todense(),
             np.array([[0., 0., 0.],
                       [1., 0., 0.],
                       [0., 1., 0.]]))
     adj = g.adj(transpose=False, scipy_fmt='coo', etype='follows')
-    assert np.allclose(
+    assert np.array_equal(
             adj.todense(),
             np.array([[0., 0., 0.],
                       [1., 0., 0.],
                       [0., 1., 0.]]))
     adj = g.adj(transpose=False, scipy_fmt='csr', etype='plays')
-    assert np.allclose(
+    assert np.array_equal(
             adj.todense(),
             np.array([[1., 1., 0.],
                       [0., 1., 1.]]))
     adj = g.adj(transpose=False, scipy_fmt='coo', etype='plays')
-    assert np.allclose(
+    assert np.array_equal(
             adj.todense(),
             np.array([[1., 1., 0.],
                       [0., 1., 1.]]))
     adj = F.sparse_to_numpy(g['follows'].adj(transpose=False))
-    assert np.allclose(
+    assert np.array_equal(
             adj,
             np.array([[0., 0., 0.],
                       [1., 0., 0.],
@@ -544,36 +546,36 @@ def test_adj(idtype):
 def test_inc(idtype):
     g = create_test_heterograph(idtype)
     adj = F.sparse_to_numpy(g['follows'].inc('in'))
-    assert np.allclose(
+    assert np.array_equal(
             adj,
             np.array([[0., 0.],
                       [1., 0.],
                       [0., 1.]]))
     adj = F.sparse_to_numpy(g['follows'].inc('out'))
-    assert np.allclose(
+    assert np.array_equal(
             adj,
             np.array([[1., 0.],
                       [0., 1.],
                       [0., 0.]]))
     adj = F.sparse_to_numpy(g['follows'].inc('both'))
-    assert np.allclose(
+    assert np.array_equal(
             adj,
             np.array([[-1., 0.],
                       [1., -1.],
                       [0., 1.]]))
     adj = F.sparse_to_numpy(g.inc('in', etype='plays'))
-    assert np.allclose(
+    assert np.array_equal(
             adj,
             np.array([[1., 1., 0., 0.],
                       [0., 0., 1., 1.]]))
     adj = F.sparse_to_numpy(g.inc('out', etype='plays'))
-    assert np.allclose(
+    assert np.array_equal(
             adj,
             np.array([[1., 0., 0., 0.],
                       [0., 1., 0., 1.],
                       [0., 0., 1., 0.]]))
     adj = F.sparse_to_numpy(g.inc('both', etype='follows'))
-    assert np.allclose(
+    assert np.array_equal(
             adj,
             np.array([[-1., 0.],
                       [1., -1.],
@@ -678,13 +680,11 @@ def test_view1(idtype):
             utype, _, vtype = HG.to_canonical_etype(etype)
             g = HG[etype]
             srcs, dsts = edges[etype]
-            for src, dst in zip(srcs, dsts):
-                assert g.has_edges_between(src, dst)
+            assert g.has_edges_between(srcs[0], dsts[0])
             assert F.asnumpy(g.has_edges_between(srcs, dsts)).all()
 
             srcs, dsts = negative_edges[etype]
-            for src, dst in zip(srcs, dsts):
-                assert not g.has_edges_between(src, dst)
+            assert not g.has_edges_between(srcs[0], dsts[0])
             assert not F.asnumpy(g.has_edges_between(srcs, dsts)).any()
 
             srcs, dsts = edges[etype]
@@ -707,10 +707,7 @@ def test_view1(idtype):
             assert g.out_degrees(0) == len(succ)
 
             # edge_id & edge_ids
-            for i, (src, dst) in enumerate(zip(srcs, dsts)):
-                assert g.edge_ids(src, dst, etype=etype) == i
-                _, _, eid = g.edge_ids(src, dst, etype=etype, return_uv=True)
-                assert eid == i
+            assert g.edge_ids(srcs[-1], dsts[-1], etype=etype) == n_edges - 1
             assert F.asnumpy(g.edge_ids(srcs, dsts)).tolist() == list(range(n_edges))
             u, v, e = g.edge_ids(srcs, dsts, return_uv=True)
             u, v, e = F.asnumpy(u), F.asnumpy(v), F.asnumpy(e)
@@ -732,12 +729,10 @@ def test_view1(idtype):
             # in_degrees & out_degrees
             in_degrees = F.asnumpy(g.in_degrees())
             out_degrees = F.asnumpy(g.out_degrees())
-            src_count = Counter(srcs)
-            dst_count = Counter(dsts)
-            for i in range(g.number_of_nodes(utype)):
-                assert out_degrees[i] == src_count[i]
-            for i in range(g.number_of_nodes(vtype)):
-                assert in_degrees[i] == dst_count[i]
+            assert np.array_equal(
+                out_degrees, np.bincount(srcs, minlength=g.number_of_nodes(utype)))
+            assert np.array_equal(
+                in_degrees, np.bincount(dsts, minlength=g.number_of_nodes(vtype)))
 
     edges = {
         'follows': ([0, 1], [1, 2]),
@@ -1524,6 +1519,38 @@ def test_updates(idtype):
         assert F.array_equal(y[0], x[0] * multiplier)
         del g.nodes['game'].data['y']
 
+@parametrize_dtype
+def test_relation_view_cache(idtype):
+    g = create_test_heterograph(idtype)
+    x = F.randn((3, 5))
+    g.nodes['user'].data['h'] = x
+    g.update_all(fn.copy_u('h', 'm'), fn.sum('m', 'y'), etype='plays')
+    y = g.nodes['game'].data['y']
+
+    # message passing in a local scope must not leak to the original frames
+    with g.local_scope():
+        g.nodes['user'].data['h'] = x * 2
+        g.update_all(fn.copy_u('h', 'm'), fn.sum('m', 'y'), etype='plays')
+        assert F.allclose(g.nodes['game'].data['y'], y * 2)
+        scope_frames = g._node_frames + g._edge_frames
+    assert F.allclose(g.nodes['game'].data['y'], y)
+    # the cache must not keep the frames of the exited scope alive
+    for entry in g._relation_view_cache.values():
+        view = entry[-1]
+        for frame in view._node_frames + view._edge_frames:
+            assert all(frame is not f for f in scope_frames)
+
+    # local_var returns a graph with its own frames
+    lg = g.local_var()
+    lg.nodes['user'].data['h'] = x * 3
+    lg.update_all(fn.copy_u('h', 'm'), fn.sum('m', 'y'), etype='plays')
+    assert F.allclose(lg.nodes['game'].data['y'], y * 3)
+    assert F.allclose(g.nodes['game'].data['y'], y)
+
+    # structure mutation
+    g.add_edges(F.tensor([0], idtype), F.tensor([0], idtype), etype='plays')
+    g.update_all(fn.copy_u('h', 'm'), fn.sum('m', 'y'), etype='plays')
+    assert F.allclose(g.nodes['game'].data['y'][0], y[0] + x[0])
 
 @parametrize_dtype
 def test_backward(idtype):
@@ -1543,6 +1570,39 @@ def test_backward(idtype):
                                               [2., 2., 2., 2., 2.],
                                               [2., 2., 2., 2., 2.]]))
 
+@parametrize_dtype
+def test_multi_update_all_fused(idtype):
+    g = dgl.heterograph({
+        ('user', 'follows', 'user'): ([0, 1, 2], [1, 1, 0]),
+        ('game', 'attracts', 'user'): ([0, 1], [1, 2]),
+        ('user', 'plays', 'game'): ([0, 2], [1, 0])
+    }, idtype=idtype, device=F.ctx())
+    xu = F.randn((3, 4))
+    xg = F.randn((2, 4))
+    g.nodes['user'].data['h'] = xu
+    g.nodes['game'].data['h'] = xg
+    g.multi_update_all(
+        {'follows': (fn.copy_u('h', 'm'), fn.sum('m', 'y')),
+         'attracts': (fn.copy_u('h', 'm'), fn.sum('m', 'y'))},
+        'sum')
+    y = g.nodes['user'].data['y']
+    g['follows'].update_all(fn.copy_u('h', 'm'), fn.sum('m', 'y1'))
+    g['attracts'].update_all(fn.copy_u('h', 'm'), fn.sum('m', 'y2'))
+    assert F.allclose(y, g.nodes['user'].data['y1'] + g.nodes['user'].data['y2'])
+
+    # relations from and to the same node type
+    g = dgl.heterograph({
+        ('user', 'follows', 'user'): ([0, 1, 2], [1, 1, 0]),
+        ('user', 'blocks', 'user'): ([1, 1], [0, 2])
+    }, idtype=idtype, device=F.ctx())
+    g.ndata['h'] = xu
+    g.multi_update_all(
+        {'follows': (fn.copy_u('h', 'm'), fn.sum('m', 'y')),
+         'blocks': (fn.copy_u('h', 'm'), fn.sum('m', 'y'))},
+        'sum')
+    assert F.allclose(g.ndata['y'], F.tensor([[1.], [0.], [0.]]) * xu[2] +
+                      F.tensor([[0.], [1.], [0.]]) * (xu[0] + xu[1]) +
+                      F.tensor([[1.], [0.], [1.]]) * xu[1])
 
 @parametrize_dtype
 def test_empty_heterograph(idtype):
@@ -1,4 +1,5 @@
 import dgl
+import dgl.function as fn
 import networkx as nx
 import backend as F
 import unittest
@@ -71,7 +72,39 @@ def test_prop_nodes_topo(idtype):
     # root node get the sum
     assert F.allclose(tree.nodes[0].data['x'], F.tensor([[3., 3.]]))
 
+@unittest.skipIf(dgl.backend.backend_name == 'tensorflow', reason="TF has no inplace write")
+@parametrize_dtype
+def test_prop_nodes_inplace(idtype):
+    g = dgl.graph(([0, 1, 0], [1, 2, 2]), idtype=idtype, device=F.ctx())
+    x = F.tensor([[1.], [2.], [3.]])
+    g.ndata['x'] = x
+    before = g.ndata['x']
+    lg = g.local_var()
+    with F.no_grad():
+        g.prop_nodes([[1], [2], [1, 2]], fn.copy_u('x', 'm'), fn.sum('m', 'x'),
+                     write_inplace=True)
+    assert F.allclose(g.ndata['x'], F.tensor([[1.], [1.], [2.]]))
+    # neither the tensor given by the user, a tensor read before the propagation,
+    # nor a clone of the graph sharing the storage is written in place
+    assert F.allclose(x, F.tensor([[1.], [2.], [3.]]))
+    assert F.allclose(before, F.tensor([[1.], [2.], [3.]]))
+    assert F.allclose(lg.ndata['x'], F.tensor([[1.], [2.], [3.]]))
+
+    # by default, a tensor read in between frontiers is never written in place
+    g.ndata['x'] = x
+    seen = []
+    def frontiers():
+        for v in [[1], [2], [1, 2]]:
+            yield v
+            seen.append(F.clone(g.ndata['x']))
+            seen.append(g.ndata['x'])
+    with F.no_grad():
+        g.prop_nodes(frontiers(), fn.copy_u('x', 'm'), fn.sum('m', 'x'))
+    for copy, read in zip(seen[::2], seen[1::2]):
+        assert F.allclose(copy, read)
+
 if __name__ == '__main__':
     test_prop_nodes_bfs()
     test_prop_edges_dfs()
     test_prop_nodes_topo()
+    test_prop_nodes_inplace()
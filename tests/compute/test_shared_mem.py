@@ -54,6 +54,17 @@ def test_single_process(idtype):
     _assert_is_identical_hetero(hg, hg_rebuild)
     _assert_is_identical_hetero(hg, hg_save_again)
 
+@unittest.skipIf(os.name == 'nt', reason='Do not support windows yet')
+@unittest.skipIf(dgl.backend.backend_name == 'tensorflow', reason='Not support tensorflow for now')
+@parametrize_dtype
+def test_created_formats(idtype):
+    hg = create_test_graph(idtype=idtype)
+    hg_share = hg.shared_memory("hg_created", formats=None)
+    assert hg_share.formats()['created'] == hg.formats()['created']
+    hg_rebuild = dgl.hetero_from_shared_memory('hg_created')
+    _assert_is_identical_hetero(hg, hg_share)
+    _assert_is_identical_hetero(hg, hg_rebuild)
+
 def sub_proc(hg_origin, name):
     hg_rebuild = dgl.hetero_from_shared_memory(name)
     hg_save_again = hg_rebuild.shared_memory(name)
@@ -84,5 +95,6 @@ def test_copy_from_gpu():
 # TODO: Test calling shared_memory with Blocks (a subclass of HeteroGraph)
 if __name__ == "__main__":
     test_single_process(F.int64)
+    test_created_formats(F.int64)
     test_multi_process(F.int32)
     test_copy_from_gpu()
@@ -290,6 +290,10 @@ def test_simple_pool():
     assert F.allclose(F.squeeze(h1, 0), F.max(h0, 0))
     h1 = sort_pool(g, h0)
     assert h1.shape[0] == 1 and h1.shape[1] == 10 * 5 and h1.dim() == 2
+    # the k nodes with the largest maximum, each with its features sorted
+    truth = h0.sort(dim=-1)[0]
+    truth = truth[truth[:, -1].argsort(descending=True)[:10]].view(1, -1)
+    assert F.allclose(h1, truth)
 
     # test#2: batched graph
     g_ = dgl.DGLGraph(nx.path_graph(5)).to(F.ctx())
@@ -841,6 +845,44 @@ def test_edge_conv(g, idtype, out_dim):
     h1 = edge_conv(g, h0)
     assert h1.shape == (g.number_of_nodes(), out_dim)
 
+    # compare with applying Theta on the feature difference of every edge
+    with g.local_scope():
+        g.srcdata['x'] = h0
+        g.dstdata['x'] = h0[:g.number_of_dst_nodes()]
+        g.apply_edges(fn.v_sub_u('x', 'x', 'd'))
+        g.edata['d'] = edge_conv.theta(g.edata['d'])
+        g.dstdata['p'] = edge_conv.phi(g.dstdata['x'])
+        g.update_all(fn.e_add_v('d', 'p', 'm'), fn.max('m', 'y'))
+        assert F.allclose(h1, g.dstdata['y'])
+
+    # hooks of Theta, such as weight normalization, are honored
+    edge_conv.theta = th.nn.utils.weight_norm(edge_conv.theta)
+    with th.no_grad():
+        edge_conv.theta.weight_g.mul_(2)
+    h1 = edge_conv(g, h0)
+    with g.local_scope():
+        g.srcdata['x'] = h0
+        g.dstdata['x'] = h0[:g.number_of_dst_nodes()]
+        g.apply_edges(fn.v_sub_u('x', 'x', 'd'))
+        g.edata['d'] = edge_conv.theta(g.edata['d'])
+        g.dstdata['p'] = edge_conv.phi(g.dstdata['x'])
+        g.update_all(fn.e_add_v('d', 'p', 'm'), fn.max('m', 'y'))
+        assert F.allclose(h1, g.dstdata['y'])
+
+    # same with batch norm on the per-edge messages
+    edge_conv = nn.EdgeConv(5, out_dim, batch_norm=True).to(ctx)
+    h1 = edge_conv(g, h0)
+    with g.local_scope():
+        g.srcdata['x'] = h0
+        g.dstdata['x'] = h0[:g.number_of_dst_nodes()]
+        g.apply_edges(fn.v_sub_u('x', 'x', 'd'))
+        g.edata['d'] = edge_conv.theta(g.edata['d'])
+        g.dstdata['p'] = edge_conv.phi(g.dstdata['x'])
+        g.apply_edges(fn.e_add_v('d', 'p', 'm'))
+        g.edata['m'] = edge_conv.bn(g.edata['m'])
+        g.update_all(fn.copy_e('m', 'm'), fn.max('m', 'y'))
+        assert F.allclose(h1, g.dstdata['y'])
+
 @parametrize_dtype
 @pytest.mark.parametrize('g', get_cases(['bipartite'], exclude=['zero-degree']))
 @pytest.mark.parametrize('out_dim', [1, 2])